@@ -1,10 +1,15 @@
+import asyncio
+import base64
+import json
+import os
 import re
+import time
 from http.cookiejar import MozillaCookieJar
+from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
 import httpx
 import structlog
-from httpx_retries import Retry, RetryTransport
 
 from .constants import (
     APPLE_MUSIC_ACCOUNT_INFO_API_URI,
@@ -20,6 +25,7 @@ from .constants import (
     APPLE_MUSIC_LICENSE_API_URL,
     APPLE_MUSIC_LIBRARY_MUSIC_VIDEO_API_URI,
     APPLE_MUSIC_MUSIC_VIDEO_API_URI,
+    APPLE_MUSIC_MUSIC_VIDEOS_API_URI,
     APPLE_MUSIC_LIBRARY_ALBUMS_API_URI,
     APPLE_MUSIC_PLAYLIST_API_URI,
     APPLE_MUSIC_SEARCH_API_URI,
@@ -27,10 +33,29 @@ from .constants import (
     APPLE_MUSIC_LIBRARY_SONG_API_URI,
     APPLE_MUSIC_LIBRARY_SONGS_API_URI,
     APPLE_MUSIC_SONG_API_URI,
+    APPLE_MUSIC_SONGS_API_URI,
     APPLE_MUSIC_UPLOADED_VIDEO_API_URL,
     APPLE_MUSIC_WEBPLAYBACK_API_URL,
+    COMPACT_METADATA_ATTRIBUTES,
+    TOKEN_REFRESH_MARGIN,
 )
+from ..utils import (
+    AdaptiveConcurrencyLimiter,
+    RequestBatcher,
+    RetryBudget,
+    decode_json,
+    TokenBucket,
+    single_flight,
+)
+from .cache import ResponseCache
 from .exceptions import GamdlApiResponseError
+from .transport import (
+    AdaptiveLimiterTransport,
+    CacheTransport,
+    CircuitBreakerTransport,
+    RateLimitTransport,
+    resolve_http2,
+)
 from .wrapper import WrapperApi
 
 logger = structlog.get_logger(__name__)
@@ -45,6 +70,13 @@ class AppleMusicApi:
         language: str,
         media_user_token: str | None = None,
         account_info: dict | None = None,
+        token_cache_path: str | None = None,
+        catalog_batch_window: float = 0.0,
+        response_cache: ResponseCache | None = None,
+        compact_metadata: bool = False,
+        include_lyrics: bool = True,
+        extend_asset_urls: bool = True,
+        fast_json: bool = False,
     ) -> None:
         self.token = token
         self.storefront = storefront
@@ -52,6 +84,28 @@ class AppleMusicApi:
         self.media_user_token = media_user_token
         self.account_info = account_info
         self.client = client
+        self.token_cache_path = token_cache_path
+        self.response_cache = response_cache
+        self.compact_metadata = compact_metadata
+        self.include_lyrics = include_lyrics
+        self.extend_asset_urls = extend_asset_urls
+        self.fast_json = fast_json
+
+        self.token_expiry = self.get_token_expiry(token)
+        self._token_lock = asyncio.Lock()
+        self.catalog_batcher = (
+            RequestBatcher(self._fetch_catalog_batch, catalog_batch_window)
+            if catalog_batch_window
+            else None
+        )
+
+    @property
+    def catalog_extend(self) -> str:
+        return "extendedAssetUrls" if self.extend_asset_urls else ""
+
+    @property
+    def song_include(self) -> str:
+        return "lyrics,albums" if self.include_lyrics else "albums"
 
     @property
     def active_subscription(self) -> bool:
@@ -75,23 +129,73 @@ class AppleMusicApi:
         return data[0].get("attributes", {}).get("restrictions")
 
     @staticmethod
-    async def get_token() -> str:
+    def get_token_expiry(token: str) -> int | None:
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return int(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def load_cached_token(token_cache_path: str) -> str | None:
+        log = logger.bind(action="load_cached_token", token_cache_path=token_cache_path)
+
+        try:
+            token = json.loads(Path(token_cache_path).read_text(encoding="utf-8"))[
+                "token"
+            ]
+        except (OSError, KeyError, TypeError, ValueError):
+            log.debug("cache_miss")
+            return None
+
+        token_expiry = AppleMusicApi.get_token_expiry(token)
+        if token_expiry is None or token_expiry - time.time() < TOKEN_REFRESH_MARGIN:
+            log.debug("token_expired", token_expiry=token_expiry)
+            return None
+
+        log.debug("success", token_expiry=token_expiry)
+
+        return token
+
+    @staticmethod
+    def save_cached_token(token_cache_path: str, token: str) -> None:
+        token_cache_path_obj = Path(token_cache_path)
+        token_cache_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = token_cache_path_obj.with_name(token_cache_path_obj.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    "token": token,
+                    "exp": AppleMusicApi.get_token_expiry(token),
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, token_cache_path_obj)
+
+    @staticmethod
+    async def get_token(client: httpx.AsyncClient | None = None) -> str:
+        if client is None:
+            async with httpx.AsyncClient() as client:
+                return await AppleMusicApi.get_token(client)
+
         log = logger.bind(action="get_token")
 
         response = None
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    APPLE_MUSIC_HOMEPAGE_URL,
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
-                home_page = response.text
-            except httpx.HTTPError:
-                raise GamdlApiResponseError(
-                    "Error fetching Apple Music homepage",
-                    status_code=response.status_code if response is not None else None,
-                )
+        try:
+            response = await client.get(
+                APPLE_MUSIC_HOMEPAGE_URL,
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+            home_page = response.text
+        except httpx.HTTPError:
+            raise GamdlApiResponseError(
+                "Error fetching Apple Music homepage",
+                status_code=response.status_code if response is not None else None,
+            )
 
         index_js_uri_match = re.search(
             r"/(assets/index[~-][^/\"]+\.js)",
@@ -104,18 +208,18 @@ class AppleMusicApi:
         index_js_uri = index_js_uri_match.group(1)
 
         response = None
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            try:
-                response = await client.get(
-                    f"{APPLE_MUSIC_HOMEPAGE_URL}/{index_js_uri}"
-                )
-                response.raise_for_status()
-                index_js_page = response.text
-            except httpx.HTTPError:
-                raise GamdlApiResponseError(
-                    "Error fetching index.js page",
-                    status_code=response.status_code if response is not None else None,
-                )
+        try:
+            response = await client.get(
+                f"{APPLE_MUSIC_HOMEPAGE_URL}/{index_js_uri}",
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+            index_js_page = response.text
+        except httpx.HTTPError:
+            raise GamdlApiResponseError(
+                "Error fetching index.js page",
+                status_code=response.status_code if response is not None else None,
+            )
 
         token_match = re.search(r'"(eyJ[A-Za-z0-9\-_]+\.eyJ[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+)"', index_js_page)
         if not token_match:
@@ -131,30 +235,39 @@ class AppleMusicApi:
         token: str,
         media_user_token: str,
         meta: str = "subscription",
+        client: httpx.AsyncClient | None = None,
     ) -> dict:
+        if client is None:
+            async with httpx.AsyncClient() as client:
+                return await AppleMusicApi.get_account_info(
+                    token,
+                    media_user_token,
+                    meta,
+                    client,
+                )
+
         log = logger.bind(action="get_account_info", meta=meta)
 
         response = None
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    APPLE_MUSIC_AMP_API_URL + APPLE_MUSIC_ACCOUNT_INFO_API_URI,
-                    params={
-                        "meta": meta,
-                    },
-                    headers={
-                        "authorization": f"Bearer {token}",
-                        "origin": APPLE_MUSIC_HOMEPAGE_URL,
-                        "cookie": f"media-user-token={media_user_token}",
-                    },
-                )
-                response.raise_for_status()
-                account_info = response.json()
-            except httpx.HTTPError:
-                raise GamdlApiResponseError(
-                    "Error fetching account info",
-                    status_code=response.status_code if response is not None else None,
-                )
+        try:
+            response = await client.get(
+                APPLE_MUSIC_AMP_API_URL + APPLE_MUSIC_ACCOUNT_INFO_API_URI,
+                params={
+                    "meta": meta,
+                },
+                headers={
+                    "authorization": f"Bearer {token}",
+                    "origin": APPLE_MUSIC_HOMEPAGE_URL,
+                    "cookie": f"media-user-token={media_user_token}",
+                },
+            )
+            response.raise_for_status()
+            account_info = response.json()
+        except httpx.HTTPError:
+            raise GamdlApiResponseError(
+                "Error fetching account info",
+                status_code=response.status_code if response is not None else None,
+            )
 
         log.debug("success", account_info=account_info)
 
@@ -167,37 +280,120 @@ class AppleMusicApi:
         language: str = "en-US",
         token: str | None = None,
         media_user_token: str | None = None,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        catalog_rate_limit: float | None = None,
+        webplayback_rate_limit: float | None = None,
+        license_rate_limit: float | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        token_cache_path: str | None = None,
+        catalog_batch_window: float = 0.02,
+        response_cache_path: str | None = None,
+        response_cache_ttl: int = 0,
+        response_cache_endpoint_ttls: dict[str, int] | None = None,
+        compact_metadata: bool = False,
+        include_lyrics: bool = True,
+        extend_asset_urls: bool = True,
+        fast_json: bool = False,
+        max_retries: int = 6,
+        retry_budget_ratio: float = 0.2,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_timeout: float = 30.0,
     ) -> "AppleMusicApi":
-        token = token or await cls.get_token()
-        account_info = (
-            await cls.get_account_info(token, media_user_token)
-            if media_user_token
+        transport = httpx.AsyncHTTPTransport(
+            http2=resolve_http2(http2),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        if limiter:
+            transport = AdaptiveLimiterTransport(limiter, transport)
+        buckets = {
+            endpoint_class: TokenBucket(rate_limit)
+            for endpoint_class, rate_limit in (
+                ("catalog", catalog_rate_limit),
+                ("webplayback", webplayback_rate_limit),
+                ("license", license_rate_limit),
+            )
+            if rate_limit
+        }
+        if buckets:
+            transport = RateLimitTransport(buckets, transport)
+        response_cache = (
+            ResponseCache(
+                response_cache_path,
+                response_cache_ttl,
+                response_cache_endpoint_ttls,
+            )
+            if response_cache_path
             else None
         )
-        storefront = (
-            account_info["meta"]["subscription"]["storefront"]
-            if account_info
-            else storefront
+        if response_cache:
+            transport = CacheTransport(response_cache, transport)
+
+        client = httpx.AsyncClient(
+            transport=CircuitBreakerTransport(
+                RetryBudget(retry_budget_ratio),
+                transport,
+                max_retries=max_retries,
+                failure_threshold=circuit_breaker_threshold,
+                recovery_timeout=circuit_breaker_timeout,
+            ),
         )
-        if not storefront:
-            raise ValueError(
-                "Storefront must be provided if it cannot be determined from account info"
+
+        try:
+            is_cached_token = False
+            if not token and token_cache_path:
+                token = cls.load_cached_token(token_cache_path)
+                is_cached_token = token is not None
+            if not token:
+                token = await cls.get_token()
+                if token_cache_path:
+                    cls.save_cached_token(token_cache_path, token)
+            try:
+                account_info = (
+                    await cls.get_account_info(token, media_user_token, client=client)
+                    if media_user_token
+                    else None
+                )
+            except GamdlApiResponseError as e:
+                if not is_cached_token or e.status_code != 401:
+                    raise
+
+                logger.debug("cached_token_rejected", action="create")
+                token = await cls.get_token()
+                cls.save_cached_token(token_cache_path, token)
+                account_info = await cls.get_account_info(
+                    token,
+                    media_user_token,
+                    client=client,
+                )
+            storefront = (
+                account_info["meta"]["subscription"]["storefront"]
+                if account_info
+                else storefront
             )
+            if not storefront:
+                raise ValueError(
+                    "Storefront must be provided if it cannot be determined from "
+                    "account info"
+                )
+        except Exception:
+            await client.aclose()
+            if response_cache:
+                response_cache.close()
+            raise
 
-        client = httpx.AsyncClient(
-            headers={
+        client.headers.update(
+            {
                 "authorization": f"Bearer {token}",
                 "origin": APPLE_MUSIC_HOMEPAGE_URL,
-            },
-            transport=RetryTransport(
-                retry=Retry(
-                    total=6,
-                    backoff_factor=1,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                )
-            ),
+            }
         )
-
         if media_user_token:
             client.headers.update(
                 {
@@ -212,6 +408,13 @@ class AppleMusicApi:
             language=language,
             media_user_token=media_user_token,
             account_info=account_info,
+            token_cache_path=token_cache_path,
+            catalog_batch_window=catalog_batch_window,
+            response_cache=response_cache,
+            compact_metadata=compact_metadata,
+            include_lyrics=include_lyrics,
+            extend_asset_urls=extend_asset_urls,
+            fast_json=fast_json,
         )
         return api
 
@@ -270,6 +473,57 @@ class AppleMusicApi:
             **kwargs,
         )
 
+    async def close(self) -> None:
+        await self.client.aclose()
+        if self.response_cache:
+            self.response_cache.close()
+
+    async def refresh_token(self, stale_token: str | None = None) -> None:
+        async with self._token_lock:
+            if stale_token is not None and self.token != stale_token:
+                return
+
+            log = logger.bind(action="refresh_token")
+
+            self.token = await self.get_token()
+            self.token_expiry = self.get_token_expiry(self.token)
+            self.client.headers["authorization"] = f"Bearer {self.token}"
+
+            if self.token_cache_path:
+                self.save_cached_token(self.token_cache_path, self.token)
+
+            log.debug("success", token_expiry=self.token_expiry)
+
+    async def _get_amp_response(
+        self,
+        uri: str,
+        params: dict | None = None,
+    ) -> httpx.Response:
+        if (
+            self.token_expiry is not None
+            and self.token_expiry - time.time() < TOKEN_REFRESH_MARGIN
+        ):
+            await self.refresh_token(self.token)
+
+        if params:
+            params = {key: value for key, value in params.items() if value != ""}
+
+        token = self.token
+        response = await self.client.get(
+            APPLE_MUSIC_AMP_API_URL + uri,
+            params=params,
+        )
+        if response.status_code != 401:
+            return response
+
+        await self.refresh_token(token)
+
+        return await self.client.get(
+            APPLE_MUSIC_AMP_API_URL + uri,
+            params=params,
+        )
+
+    @single_flight(copy_result=True)
     async def _amp_request(
         self,
         uri: str,
@@ -277,12 +531,9 @@ class AppleMusicApi:
     ) -> dict:
         response = None
         try:
-            response = await self.client.get(
-                APPLE_MUSIC_AMP_API_URL + uri,
-                params=params,
-            )
+            response = await self._get_amp_response(uri, params)
             response.raise_for_status()
-            response_json = response.json()
+            response_json = decode_json(response.content, self.fast_json)
         except httpx.HTTPError:
             raise GamdlApiResponseError(
                 "Error fetching from AMP API",
@@ -296,30 +547,93 @@ class AppleMusicApi:
                 content=response_json["errors"],
             )
 
+        if self.compact_metadata:
+            self.compact_response(response_json)
+
         return response_json
 
+    @classmethod
+    def compact_response(cls, response_json: dict) -> None:
+        for resource in response_json.get("data", []):
+            cls.compact_resource(resource)
+
+    @classmethod
+    def compact_resource(cls, resource: dict) -> None:
+        if not isinstance(resource, dict):
+            return
+
+        attributes = resource.get("attributes")
+        if isinstance(attributes, dict):
+            resource["attributes"] = {
+                key: value
+                for key, value in attributes.items()
+                if key in COMPACT_METADATA_ATTRIBUTES
+            }
+
+        for relation_key in ("relationships", "views"):
+            for relation in resource.get(relation_key, {}).values():
+                for related_resource in relation.get("data", []):
+                    cls.compact_resource(related_resource)
+
     async def get_song(
         self,
         song_id: str,
-        extend: str = "extendedAssetUrls",
-        include: str = "lyrics,albums",
+        extend: str | None = None,
+        include: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_song", song_id=song_id)
 
-        song = await self._amp_request(
-            APPLE_MUSIC_SONG_API_URI.format(
-                storefront=self.storefront,
-                song_id=song_id,
-            ),
+        if extend is None:
+            extend = self.catalog_extend
+        if include is None:
+            include = self.song_include
+
+        if self.catalog_batcher:
+            song = await self._get_batched_catalog_resource(
+                ("songs", extend, include),
+                song_id,
+            )
+        else:
+            song = await self._amp_request(
+                APPLE_MUSIC_SONG_API_URI.format(
+                    storefront=self.storefront,
+                    song_id=song_id,
+                ),
+                {
+                    "extend": extend,
+                    "include": include,
+                },
+            )
+
+        log.debug("success", song=song)
+
+        return song
+
+    async def get_songs(
+        self,
+        song_ids: list[str],
+        extend: str | None = None,
+        include: str | None = None,
+    ) -> dict:
+        log = logger.bind(action="get_songs", song_ids=song_ids)
+
+        if extend is None:
+            extend = self.catalog_extend
+        if include is None:
+            include = self.song_include
+
+        songs = await self._amp_request(
+            APPLE_MUSIC_SONGS_API_URI.format(storefront=self.storefront),
             {
+                "ids": ",".join(song_ids),
                 "extend": extend,
                 "include": include,
             },
         )
 
-        log.debug("success", song=song)
+        log.debug("success", songs=songs)
 
-        return song
+        return songs
 
     async def get_music_video(
         self,
@@ -328,19 +642,72 @@ class AppleMusicApi:
     ) -> dict:
         log = logger.bind(action="get_music_video", music_video_id=music_video_id)
 
-        music_video = await self._amp_request(
-            APPLE_MUSIC_MUSIC_VIDEO_API_URI.format(
-                storefront=self.storefront,
-                music_video_id=music_video_id,
-            ),
+        if self.catalog_batcher:
+            music_video = await self._get_batched_catalog_resource(
+                ("music-videos", None, include),
+                music_video_id,
+            )
+        else:
+            music_video = await self._amp_request(
+                APPLE_MUSIC_MUSIC_VIDEO_API_URI.format(
+                    storefront=self.storefront,
+                    music_video_id=music_video_id,
+                ),
+                {
+                    "include": include,
+                },
+            )
+
+        log.debug("success", music_video=music_video)
+
+        return music_video
+
+    async def get_music_videos(
+        self,
+        music_video_ids: list[str],
+        include: str = "albums",
+    ) -> dict:
+        log = logger.bind(action="get_music_videos", music_video_ids=music_video_ids)
+
+        music_videos = await self._amp_request(
+            APPLE_MUSIC_MUSIC_VIDEOS_API_URI.format(storefront=self.storefront),
             {
+                "ids": ",".join(music_video_ids),
                 "include": include,
             },
         )
 
-        log.debug("success", music_video=music_video)
+        log.debug("success", music_videos=music_videos)
 
-        return music_video
+        return music_videos
+
+    async def _fetch_catalog_batch(
+        self,
+        group: tuple[str, str | None, str],
+        resource_ids: list[str],
+    ) -> dict[str, dict]:
+        resource_type, extend, include = group
+
+        if resource_type == "songs":
+            response = await self.get_songs(resource_ids, extend, include)
+        else:
+            response = await self.get_music_videos(resource_ids, include)
+
+        return {resource["id"]: resource for resource in response["data"]}
+
+    async def _get_batched_catalog_resource(
+        self,
+        group: tuple[str, str | None, str],
+        resource_id: str,
+    ) -> dict:
+        resource = await self.catalog_batcher.get(group, resource_id)
+        if resource is None:
+            raise GamdlApiResponseError(
+                "Error fetching from AMP API",
+                content=f"{group[0]} {resource_id} not found",
+            )
+
+        return {"data": [resource]}
 
     async def get_uploaded_video(
         self,
@@ -364,10 +731,13 @@ class AppleMusicApi:
     async def get_album(
         self,
         album_id: str,
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_album", album_id=album_id)
 
+        if extend is None:
+            extend = self.catalog_extend
+
         album = await self._amp_request(
             APPLE_MUSIC_ALBUM_API_URI.format(
                 storefront=self.storefront,
@@ -386,10 +756,13 @@ class AppleMusicApi:
         self,
         playlist_id: str,
         limit_tracks: int = 300,
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_playlist", playlist_id=playlist_id)
 
+        if extend is None:
+            extend = self.catalog_extend
+
         playlist = await self._amp_request(
             APPLE_MUSIC_PLAYLIST_API_URI.format(
                 storefront=self.storefront,
@@ -437,10 +810,13 @@ class AppleMusicApi:
         self,
         song_id: str,
         include: str = "catalog",
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_library_song", song_id=song_id)
 
+        if extend is None:
+            extend = self.catalog_extend
+
         song = await self._amp_request(
             APPLE_MUSIC_LIBRARY_SONG_API_URI.format(
                 song_id=song_id,
@@ -481,10 +857,13 @@ class AppleMusicApi:
         self,
         album_id: str,
         include: str = "catalog",
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_library_album", album_id=album_id)
 
+        if extend is None:
+            extend = self.catalog_extend
+
         album = await self._amp_request(
             APPLE_MUSIC_LIBRARY_ALBUM_API_URI.format(
                 album_id=album_id,
@@ -504,10 +883,13 @@ class AppleMusicApi:
         playlist_id: str,
         include: str = "catalog,tracks",
         limit: int = 100,
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_library_playlist", playlist_id=playlist_id)
 
+        if extend is None:
+            extend = self.catalog_extend
+
         playlist = await self._amp_request(
             APPLE_MUSIC_LIBRARY_PLAYLIST_API_URI.format(
                 playlist_id=playlist_id,
@@ -528,10 +910,13 @@ class AppleMusicApi:
         limit: int = 100,
         offset: int = 0,
         include: str = "catalog",
-        extend: str = "extendedAssetUrls",
+        extend: str | None = None,
     ) -> dict:
         log = logger.bind(action="get_library_songs")
 
+        if extend is None:
+            extend = self.catalog_extend
+
         library_songs = await self._amp_request(
             APPLE_MUSIC_LIBRARY_SONGS_API_URI,
             {
@@ -702,6 +1087,7 @@ class AppleMusicApi:
 
         return extended_data
 
+    @single_flight(copy_result=True)
     async def get_webplayback(
         self,
         track_id: str,
@@ -0,0 +1,124 @@
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+
+from .constants import APPLE_MUSIC_AMP_API_URL
+
+CACHED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CachedResponse:
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: str,
+        ttl: int = 0,
+        endpoint_ttls: dict[str, int] | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.endpoint_ttls = endpoint_ttls or {}
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.cursor = self.connection.cursor()
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self.connection.commit()
+
+    @staticmethod
+    def get_endpoint(url: str) -> str | None:
+        path_parts = urlparse(url).path.split("/")
+        if len(path_parts) < 5 or path_parts[1:3] != ["v1", "catalog"]:
+            return None
+
+        return path_parts[4]
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        url = str(request.url)
+        return (
+            request.method == "GET"
+            and url.startswith(APPLE_MUSIC_AMP_API_URL)
+            and self.get_endpoint(url) is not None
+        )
+
+    def get_ttl(self, url: str) -> int:
+        return self.endpoint_ttls.get(self.get_endpoint(url), self.ttl)
+
+    def is_fresh(self, url: str, cached_response: CachedResponse) -> bool:
+        return time.time() - cached_response.stored_at < self.get_ttl(url)
+
+    def get(self, url: str) -> CachedResponse | None:
+        self.cursor.execute(
+            "SELECT status_code, headers, content, stored_at FROM responses "
+            "WHERE url = ?",
+            (url,),
+        )
+        row = self.cursor.fetchone()
+        if not row:
+            return None
+
+        status_code, headers, content, stored_at = row
+        return CachedResponse(status_code, json.loads(headers), content, stored_at)
+
+    def set(self, url: str, response: httpx.Response, content: bytes) -> None:
+        headers = {
+            name: response.headers[name]
+            for name in CACHED_HEADERS
+            if name in response.headers
+        }
+        self.cursor.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(url, status_code, headers, content, stored_at) VALUES (?, ?, ?, ?, ?)",
+            (url, response.status_code, json.dumps(headers), content, time.time()),
+        )
+        self.connection.commit()
+
+    def touch(self, url: str) -> None:
+        self.cursor.execute(
+            "UPDATE responses SET stored_at = ? WHERE url = ?",
+            (time.time(), url),
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.close()
@@ -5,9 +5,11 @@ APPLE_MUSIC_COOKIE_DOMAIN = ".music.apple.com"
 APPLE_MUSIC_AMP_API_URL = "https://amp-api.music.apple.com"
 APPLE_MUSIC_ACCOUNT_INFO_API_URI = "/v1/me/account"
 APPLE_MUSIC_SONG_API_URI = "/v1/catalog/{storefront}/songs/{song_id}"
+APPLE_MUSIC_SONGS_API_URI = "/v1/catalog/{storefront}/songs"
 APPLE_MUSIC_MUSIC_VIDEO_API_URI = (
     "/v1/catalog/{storefront}/music-videos/{music_video_id}"
 )
+APPLE_MUSIC_MUSIC_VIDEOS_API_URI = "/v1/catalog/{storefront}/music-videos"
 APPLE_MUSIC_UPLOADED_VIDEO_API_URL = (
     "/v1/catalog/{storefront}/uploaded-videos/{uploaded_video_id}"
 )
@@ -41,3 +43,80 @@ APPLE_MUSIC_MUSIC_KIT_URL = (
 
 ITUNES_LOOKUP_API_URL = "https://itunes.apple.com/lookup"
 ITUNES_PAGE_API_URL = "https://music.apple.com/{media_type}/{media_id}"
+
+TOKEN_REFRESH_MARGIN = 3600
+
+COMPACT_METADATA_ATTRIBUTES = frozenset(
+    {
+        "albumName",
+        "artistName",
+        "artwork",
+        "assetTokens",
+        "contentRating",
+        "curatorName",
+        "durationInMillis",
+        "hasLyrics",
+        "isCompilation",
+        "name",
+        "playParams",
+        "releaseDate",
+        "trackCount",
+        "ttml",
+        "uploadDate",
+        "url",
+    }
+)
+
+STOREFRONT_IDS = {
+    "us": 143441,
+    "fr": 143442,
+    "de": 143443,
+    "gb": 143444,
+    "at": 143445,
+    "be": 143446,
+    "fi": 143447,
+    "gr": 143448,
+    "ie": 143449,
+    "it": 143450,
+    "lu": 143451,
+    "nl": 143452,
+    "pt": 143453,
+    "es": 143454,
+    "ca": 143455,
+    "se": 143456,
+    "no": 143457,
+    "dk": 143458,
+    "ch": 143459,
+    "au": 143460,
+    "nz": 143461,
+    "jp": 143462,
+    "hk": 143463,
+    "sg": 143464,
+    "cn": 143465,
+    "kr": 143466,
+    "in": 143467,
+    "mx": 143468,
+    "ru": 143469,
+    "tw": 143470,
+    "vn": 143471,
+    "za": 143472,
+    "my": 143473,
+    "ph": 143474,
+    "th": 143475,
+    "id": 143476,
+    "pk": 143477,
+    "pl": 143478,
+    "sa": 143479,
+    "tr": 143480,
+    "ae": 143481,
+    "hu": 143482,
+    "cl": 143483,
+    "ro": 143487,
+    "cz": 143489,
+    "il": 143491,
+    "ua": 143492,
+    "co": 143501,
+    "br": 143503,
+    "ar": 143505,
+    "pe": 143507,
+}
@@ -1,4 +1,7 @@
+import json
+import os
 import re
+from pathlib import Path
 
 import httpx
 import structlog
@@ -7,8 +10,11 @@ from .constants import (
     APPLE_MUSIC_MUSIC_KIT_URL,
     ITUNES_LOOKUP_API_URL,
     ITUNES_PAGE_API_URL,
+    STOREFRONT_IDS,
 )
+from ..utils import single_flight
 from .exceptions import GamdlApiResponseError
+from .transport import resolve_http2
 
 logger = structlog.get_logger(__name__)
 
@@ -27,9 +33,60 @@ class ItunesApi:
         self.storefront_id = storefront_id
 
     @staticmethod
-    async def get_storefront_id(storefront: str) -> int:
+    def load_storefront_ids(storefront_cache_path: str | None = None) -> dict[str, int]:
+        storefront_ids = dict(STOREFRONT_IDS)
+        if not storefront_cache_path:
+            return storefront_ids
+
+        try:
+            storefront_ids.update(
+                json.loads(Path(storefront_cache_path).read_text(encoding="utf-8"))
+            )
+        except (OSError, ValueError):
+            pass
+
+        return storefront_ids
+
+    @staticmethod
+    def save_storefront_ids(
+        storefront_cache_path: str,
+        storefront_ids: dict[str, int],
+    ) -> None:
+        storefront_cache_path_obj = Path(storefront_cache_path)
+        storefront_cache_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = storefront_cache_path_obj.with_name(
+            storefront_cache_path_obj.name + ".tmp"
+        )
+        temp_path.write_text(json.dumps(storefront_ids), encoding="utf-8")
+        os.replace(temp_path, storefront_cache_path_obj)
+
+    @staticmethod
+    def parse_storefront_ids(music_kit_content: str) -> dict[str, int]:
+        three_letter_codes = dict(
+            re.findall(r'\b([A-Z]{2}):"([A-Z]{3})"', music_kit_content)
+        )
+        numeric_ids = dict(re.findall(r'\b([A-Z]{3}):"(\d+)"', music_kit_content))
+
+        return {
+            country_code.lower(): int(numeric_ids[three_letter_code])
+            for country_code, three_letter_code in three_letter_codes.items()
+            if three_letter_code in numeric_ids
+        }
+
+    @staticmethod
+    async def get_storefront_id(
+        storefront: str,
+        storefront_cache_path: str | None = None,
+    ) -> int:
         log = logger.bind(action="get_storefront_id", storefront=storefront)
 
+        storefront_ids = ItunesApi.load_storefront_ids(storefront_cache_path)
+        storefront_id = storefront_ids.get(storefront.lower())
+        if storefront_id:
+            log.debug("cache_hit", storefront_id=storefront_id)
+            return storefront_id
+
         response = None
         async with httpx.AsyncClient() as client:
             try:
@@ -62,6 +119,11 @@ class ItunesApi:
 
         storefront_id = int(storefront_match.group(1))
 
+        if storefront_cache_path:
+            storefront_ids.update(ItunesApi.parse_storefront_ids(music_kit_content))
+            storefront_ids[storefront.lower()] = storefront_id
+            ItunesApi.save_storefront_ids(storefront_cache_path, storefront_ids)
+
         log.debug("success", storefront_id=storefront_id)
 
         return storefront_id
@@ -72,12 +134,18 @@ class ItunesApi:
         storefront: str = "us",
         storefront_id: int | None = 143441,
         language: str = "en-US",
+        http2: bool = False,
+        storefront_cache_path: str | None = None,
     ) -> "ItunesApi":
-        storefront_id = storefront_id or await cls.get_storefront_id(storefront)
+        storefront_id = storefront_id or await cls.get_storefront_id(
+            storefront,
+            storefront_cache_path,
+        )
 
         client = httpx.AsyncClient(
             timeout=60.0,
             follow_redirects=True,
+            http2=resolve_http2(http2),
         )
 
         return cls(
@@ -87,6 +155,7 @@ class ItunesApi:
             storefront_id=storefront_id,
         )
 
+    @single_flight(copy_result=True)
     async def get_lookup_result(
         self,
         media_id: str,
@@ -118,6 +187,7 @@ class ItunesApi:
 
         return lookup_result
 
+    @single_flight(copy_result=True)
     async def get_itunes_page(
         self,
         media_type: str,
@@ -0,0 +1,253 @@
+import asyncio
+import email.utils
+import functools
+import importlib.util
+import random
+import time
+
+import httpx
+import structlog
+
+from ..utils import AdaptiveConcurrencyLimiter, CircuitBreaker, RetryBudget, TokenBucket
+from .cache import ResponseCache
+from .constants import APPLE_MUSIC_LICENSE_API_URL, APPLE_MUSIC_WEBPLAYBACK_API_URL
+
+logger = structlog.get_logger(__name__)
+
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@functools.cache
+def _is_http2_available() -> bool:
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            'HTTP/2 requested but the "h2" package is not installed, '
+            "falling back to HTTP/1.1",
+            action="resolve_http2",
+        )
+        return False
+
+    return True
+
+
+def resolve_http2(http2: bool) -> bool:
+    return http2 and _is_http2_available()
+
+
+def get_endpoint_class(url: str) -> str:
+    if url.startswith(APPLE_MUSIC_WEBPLAYBACK_API_URL):
+        return "webplayback"
+
+    if url.startswith(APPLE_MUSIC_LICENSE_API_URL):
+        return "license"
+
+    return "catalog"
+
+
+def get_retry_after(response: httpx.Response) -> float | None:
+    retry_after = response.headers.get("retry-after")
+    if not retry_after:
+        return None
+
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        budget: RetryBudget,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_retries: int = 6,
+        backoff_factor: float = 1.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        self.budget = budget
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def get_breaker(self, endpoint_class: str) -> CircuitBreaker:
+        if endpoint_class not in self.breakers:
+            self.breakers[endpoint_class] = CircuitBreaker(
+                endpoint_class,
+                self.failure_threshold,
+                self.recovery_timeout,
+            )
+
+        return self.breakers[endpoint_class]
+
+    def _should_retry(self, breaker: CircuitBreaker, attempt: int) -> bool:
+        if attempt >= self.max_retries:
+            return False
+
+        return breaker.state != "closed" or self.budget.try_retry()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self.get_breaker(get_endpoint_class(str(request.url)))
+        self.budget.record_request()
+
+        attempt = 0
+        while True:
+            await breaker.acquire()
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError:
+                breaker.record_failure()
+                if not self._should_retry(breaker, attempt):
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in THROTTLE_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+
+                breaker.record_failure(get_retry_after(response))
+                if not self._should_retry(breaker, attempt):
+                    return response
+
+                await response.aclose()
+
+            attempt += 1
+            logger.debug(
+                "retry",
+                action="circuit_breaker",
+                name=breaker.name,
+                url=str(request.url),
+                attempt=attempt,
+                state=breaker.state,
+            )
+            if breaker.state == "closed":
+                await asyncio.sleep(
+                    random.uniform(0, self.backoff_factor * 2 ** (attempt - 1))
+                )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        buckets: dict[str, TokenBucket],
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.buckets = buckets
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self.buckets.get(get_endpoint_class(str(request.url)))
+        if bucket:
+            await bucket.acquire()
+
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class AdaptiveLimiterTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.limiter = limiter
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            self.limiter.record_throttle()
+            raise
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            self.limiter.record_throttle(response.status_code)
+        else:
+            self.limiter.record_success()
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class CacheTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        cache: ResponseCache,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.cache = cache
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.cache.is_cacheable(request):
+            return await self.transport.handle_async_request(request)
+
+        url = str(request.url)
+        log = logger.bind(action="response_cache", url=url)
+
+        cached_response = self.cache.get(url)
+        if cached_response:
+            if self.cache.is_fresh(url, cached_response):
+                log.debug("hit")
+                return cached_response.to_response(request)
+
+            if cached_response.etag:
+                request.headers["if-none-match"] = cached_response.etag
+            if cached_response.last_modified:
+                request.headers["if-modified-since"] = cached_response.last_modified
+
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 304 and cached_response:
+            await response.aclose()
+            self.cache.touch(url)
+            log.debug("revalidated")
+            return cached_response.to_response(request)
+
+        if response.status_code != 200:
+            return response
+
+        content = await response.aread()
+        if (
+            "etag" in response.headers
+            or "last-modified" in response.headers
+            or self.cache.get_ttl(url) > 0
+        ):
+            self.cache.set(url, response, content)
+            log.debug("stored")
+
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in {"content-encoding", "content-length"}
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -8,6 +8,7 @@ import httpx
 import structlog
 
 from .exceptions import GamdlApiResponseError
+from .transport import resolve_http2
 
 logger = structlog.get_logger(__name__)
 
@@ -51,9 +52,11 @@ class WrapperApi:
         decrypt_port: int = 10020,
         get_credentials_func: CredentialsFunc | None = None,
         get_2fa_code: TwoFactorCodeFunc | None = None,
+        http2: bool = False,
     ) -> WrapperApi:
         client = httpx.AsyncClient(
             timeout=httpx.Timeout(600.0, connect=30.0),
+            http2=resolve_http2(http2),
         )
 
         base_url = base_url.rstrip("/")
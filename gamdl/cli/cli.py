@@ -14,9 +14,11 @@ from ..api.wrapper import WrapperApi
 from ..downloader import (
     AppleMusicBaseDownloader,
     AppleMusicDownloader,
+    AppleMusicDownloadPipeline,
     AppleMusicMusicVideoDownloader,
     AppleMusicSongDownloader,
     AppleMusicUploadedVideoDownloader,
+    DownloadItem,
     GamdlDownloaderDependencyNotFoundError,
     GamdlDownloaderMediaFileExistsError,
     GamdlDownloaderSyncedLyricsOnlyError,
@@ -35,6 +37,7 @@ from ..interface import (
     GamdlInterfaceUrlParseError,
 )
 from ..interface.enums import SongCodec
+from ..utils import AdaptiveConcurrencyLimiter
 from .cli_config import CliConfig
 from .config_file import ConfigFile
 from .database import Database
@@ -83,6 +86,24 @@ async def main(config: CliConfig):
         artist_auto_select=config.artist_auto_select,
     )
 
+    if config.adaptive_concurrency:
+        metadata_limiter = AdaptiveConcurrencyLimiter(
+            "metadata",
+            maximum=config.metadata_concurrency,
+        )
+        download_limiter = AdaptiveConcurrencyLimiter(
+            "download",
+            maximum=config.download_concurrency,
+        )
+    else:
+        metadata_limiter = None
+        download_limiter = None
+
+    include_lyrics = not (
+        config.no_synced_lyrics
+        and {"lyrics", "all"} & set(config.exclude_tags or [])
+    )
+
     if config.use_wrapper:
         try:
             wrapper_api = await WrapperApi.create(
@@ -91,10 +112,32 @@ async def main(config: CliConfig):
                 decrypt_port=config.wrapper_decrypt_port,
                 get_credentials_func=InteractivePrompts.get_wrapper_credentials,
                 get_2fa_code=InteractivePrompts.get_wrapper_2fa_code,
+                http2=config.http2,
             )
             apple_music_api = await AppleMusicApi.create_from_wrapper(
                 wrapper_api=wrapper_api,
                 language=config.language,
+                limiter=metadata_limiter,
+                catalog_rate_limit=config.catalog_rate_limit,
+                webplayback_rate_limit=config.webplayback_rate_limit,
+                license_rate_limit=config.license_rate_limit,
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+                http2=config.http2,
+                token_cache_path=config.token_cache_path,
+                catalog_batch_window=config.catalog_batch_window,
+                response_cache_path=config.response_cache_path,
+                response_cache_ttl=config.response_cache_ttl,
+                response_cache_endpoint_ttls=config.response_cache_endpoint_ttls,
+                compact_metadata=config.compact_metadata,
+                fast_json=config.fast_json,
+                include_lyrics=include_lyrics,
+                extend_asset_urls=False,
+                max_retries=config.max_retries,
+                retry_budget_ratio=config.retry_budget_ratio,
+                circuit_breaker_threshold=config.circuit_breaker_threshold,
+                circuit_breaker_timeout=config.circuit_breaker_timeout,
             )
         except Exception as e:
             logger.exception(f"Error: {e}")
@@ -104,6 +147,27 @@ async def main(config: CliConfig):
         apple_music_api = await AppleMusicApi.create_from_netscape_cookies(
             cookies_path=cookies_path,
             language=config.language,
+            limiter=metadata_limiter,
+            catalog_rate_limit=config.catalog_rate_limit,
+            webplayback_rate_limit=config.webplayback_rate_limit,
+            license_rate_limit=config.license_rate_limit,
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+            http2=config.http2,
+            token_cache_path=config.token_cache_path,
+            catalog_batch_window=config.catalog_batch_window,
+            response_cache_path=config.response_cache_path,
+            response_cache_ttl=config.response_cache_ttl,
+            response_cache_endpoint_ttls=config.response_cache_endpoint_ttls,
+            compact_metadata=config.compact_metadata,
+            fast_json=config.fast_json,
+            include_lyrics=include_lyrics,
+            extend_asset_urls=False,
+            max_retries=config.max_retries,
+            retry_budget_ratio=config.retry_budget_ratio,
+            circuit_breaker_threshold=config.circuit_breaker_threshold,
+            circuit_breaker_timeout=config.circuit_breaker_timeout,
         )
         wrapper_api = None
 
@@ -140,6 +204,11 @@ async def main(config: CliConfig):
         cover_size=config.cover_size,
         wvd_path=config.wvd_path,
         wrapper_api=wrapper_api,
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+        http2=config.http2,
+        storefront_cache_path=config.storefront_cache_path,
     )
 
     song_interface = AppleMusicSongInterface(
@@ -170,6 +239,11 @@ async def main(config: CliConfig):
         artist_select_media_type_function=interactive_prompts.ask_artist_media_type,
         artist_select_items_function=interactive_prompts.ask_artist_select_items,
         flat_filter_function=flat_filter,
+        concurrency=config.metadata_concurrency,
+        prefetch=config.prefetch,
+        prefetch_ttl=config.prefetch_ttl,
+        deduplicate=config.deduplicate,
+        limiter=metadata_limiter,
     )
 
     base_downloader = AppleMusicBaseDownloader(
@@ -190,6 +264,13 @@ async def main(config: CliConfig):
         date_tag_template=config.date_tag_template,
         exclude_tags=config.exclude_tags,
         truncate=config.truncate,
+        decrypt_concurrency=config.decrypt_concurrency,
+        download_limiter=download_limiter,
+        native_concurrency=config.native_concurrency,
+        ytdlp_workers=config.ytdlp_workers,
+        ytdlp_max_jobs_per_worker=config.ytdlp_max_jobs_per_worker,
+        resume=config.resume,
+        max_retries=config.max_retries,
     )
 
     song_downloader = AppleMusicSongDownloader(
@@ -212,6 +293,8 @@ async def main(config: CliConfig):
         save_playlist=config.save_playlist,
         no_synced_lyrics=config.no_synced_lyrics,
         synced_lyrics_only=config.synced_lyrics_only,
+        concurrency=config.download_concurrency,
+        deduplicate=config.deduplicate,
     )
 
     if config.read_urls_as_txt:
@@ -229,78 +312,179 @@ async def main(config: CliConfig):
     else:
         urls = config.urls
 
+    pipeline = AppleMusicDownloadPipeline(downloader)
+    pipeline.start()
+
+    url_queue = asyncio.Queue()
+    url_scheduler = asyncio.create_task(
+        schedule_urls(
+            downloader,
+            pipeline,
+            urls,
+            url_queue,
+            config.url_concurrency,
+        )
+    )
+
     error_count = 0
-    for url_index, url in enumerate(urls, 1):
-        url_log = logger.bind(action=f"URL {url_index:>3}/{len(urls):<3}")
+    try:
+        for url_index, url in enumerate(urls, 1):
+            url_log = logger.bind(action=f"URL {url_index:>3}/{len(urls):<3}")
+
+            url_log.info(f'Processing "{url}"')
+
+            report_queue, producer, started_items, reporting = await url_queue.get()
+
+            reporting.set()
+            for download_item in started_items:
+                log_download_start(download_item)
+            started_items.clear()
+
+            try:
+                while (report := await report_queue.get()) is not None:
+                    download_item, download_future = report
+                    error_count += await report_download_item(
+                        download_item,
+                        download_future,
+                        database,
+                    )
 
-        url_log.info(f'Processing "{url}"')
+                await producer
+            except GamdlInterfaceUrlParseError as e:
+                url_log.error(f"{e}")
+                continue
+            except Exception as e:
+                url_log.exception(f'Error processing "{url}": {e}')
+                error_count += 1
+                continue
+            finally:
+                producer.cancel()
+    finally:
+        url_scheduler.cancel()
+        await pipeline.close()
+        await base_downloader.close()
+        await base_interface.close()
+        await apple_music_api.close()
 
-        try:
-            async for download_item in downloader.get_download_item_from_url(url):
-                media_index = download_item.media.index + 1
-                media_total = download_item.media.total or "-"
+    logger.info(f"Finished with {error_count} error(s)")
 
-                track_log = logger.bind(
-                    action=f"Track {media_index:>3}/{media_total:<3}"
-                )
 
-                media_title = (
-                    download_item.media.media_metadata["attributes"]["name"]
-                    if download_item.media.media_metadata
-                    and download_item.media.media_metadata.get("attributes", {}).get(
-                        "name"
-                    )
-                    else "Unknown Title"
-                )
-                media_type = (
-                    download_item.media.media_metadata["type"]
-                    if download_item.media.media_metadata
-                    else None
-                )
+async def schedule_urls(
+    downloader: AppleMusicDownloader,
+    pipeline: AppleMusicDownloadPipeline,
+    urls: list[str],
+    url_queue: asyncio.Queue,
+    url_concurrency: int,
+) -> None:
+    url_semaphore = asyncio.Semaphore(url_concurrency)
+
+    for url in urls:
+        await url_semaphore.acquire()
+
+        report_queue = asyncio.Queue(maxsize=downloader.concurrency * 2)
+        started_items = []
+        reporting = asyncio.Event()
+        producer = asyncio.create_task(
+            enqueue_download_items(
+                downloader,
+                pipeline,
+                url,
+                report_queue,
+                started_items,
+                reporting,
+            )
+        )
+        producer.add_done_callback(lambda _: url_semaphore.release())
+
+        await url_queue.put((report_queue, producer, started_items, reporting))
+
+
+async def enqueue_download_items(
+    downloader: AppleMusicDownloader,
+    pipeline: AppleMusicDownloadPipeline,
+    url: str,
+    report_queue: asyncio.Queue,
+    started_items: list[DownloadItem],
+    reporting: asyncio.Event,
+) -> None:
+    try:
+        async for download_item in downloader.get_download_item_from_url(url):
+            if reporting.is_set():
+                log_download_start(download_item)
+            else:
+                started_items.append(download_item)
+            download_future = await pipeline.submit(download_item)
+            await report_queue.put((download_item, download_future))
+    finally:
+        await report_queue.put(None)
+
+
+def get_track_log(download_item: DownloadItem) -> tuple:
+    media_index = download_item.media.index + 1
+    media_total = download_item.media.total or "-"
+
+    track_log = logger.bind(action=f"Track {media_index:>3}/{media_total:<3}")
+
+    media_title = (
+        download_item.media.media_metadata["attributes"]["name"]
+        if download_item.media.media_metadata
+        and download_item.media.media_metadata.get("attributes", {}).get("name")
+        else "Unknown Title"
+    )
 
-                if download_item.media.partial and media_type in {
-                    None,
-                    "songs",
-                    "library-songs",
-                    "music-videos",
-                    "library-music-videos",
-                    "uploaded-videos",
-                }:
-                    track_log.info(f'Downloading "{media_title}"')
-
-                try:
-                    await downloader.download(download_item)
-                except (
-                    GamdlInterfaceMediaNotStreamableError,
-                    GamdlInterfaceFormatNotAvailableError,
-                    GamdlInterfaceDecryptionNotAvailableError,
-                    GamdlInterfaceArtistMediaTypeError,
-                    GamdlDownloaderSyncedLyricsOnlyError,
-                    GamdlDownloaderMediaFileExistsError,
-                    GamdlDownloaderDependencyNotFoundError,
-                    GamdlInterfaceFlatFilterExcludedError,
-                ) as e:
-                    track_log.warning(f'Skipping "{media_title}": {e}')
-                    continue
-                except Exception as e:
-                    error_count += 1
-                    track_log.exception(f'Error downloading "{media_title}"')
-
-                if (
-                    database
-                    and download_item.media.media_metadata
-                    and download_item.final_path
-                ):
-                    database.add(
-                        download_item.media.media_metadata["id"],
-                        download_item.final_path,
-                    )
-        except GamdlInterfaceUrlParseError as e:
-            url_log.error(f"{e}")
-            continue
-        except Exception as e:
-            url_log.exception(f'Error processing "{url}": {e}')
-            error_count += 1
-            continue
+    return track_log, media_title
 
-    logger.info(f"Finished with {error_count} error(s)")
+
+def log_download_start(download_item: DownloadItem) -> None:
+    track_log, media_title = get_track_log(download_item)
+
+    media_type = (
+        download_item.media.media_metadata["type"]
+        if download_item.media.media_metadata
+        else None
+    )
+
+    if download_item.media.partial and media_type in {
+        None,
+        "songs",
+        "library-songs",
+        "music-videos",
+        "library-music-videos",
+        "uploaded-videos",
+    }:
+        track_log.info(f'Downloading "{media_title}"')
+
+
+async def report_download_item(
+    download_item: DownloadItem,
+    download_future: asyncio.Future,
+    database: Database | None,
+) -> int:
+    track_log, media_title = get_track_log(download_item)
+
+    error_count = 0
+    try:
+        await download_future
+    except (
+        GamdlInterfaceMediaNotStreamableError,
+        GamdlInterfaceFormatNotAvailableError,
+        GamdlInterfaceDecryptionNotAvailableError,
+        GamdlInterfaceArtistMediaTypeError,
+        GamdlDownloaderSyncedLyricsOnlyError,
+        GamdlDownloaderMediaFileExistsError,
+        GamdlDownloaderDependencyNotFoundError,
+        GamdlInterfaceFlatFilterExcludedError,
+    ) as e:
+        track_log.warning(f'Skipping "{media_title}": {e}')
+        return error_count
+    except Exception:
+        error_count += 1
+        track_log.exception(f'Error downloading "{media_title}"')
+
+    if database and download_item.media.media_metadata and download_item.final_path:
+        database.add(
+            download_item.media.media_metadata["id"],
+            download_item.final_path,
+        )
+
+    return error_count
@@ -29,7 +29,7 @@ from ..interface import (
     SyncedLyricsFormat,
     UploadedVideoQuality,
 )
-from .utils import Csv
+from .utils import Csv, KeyValueInt
 
 api_from_cookies_sig = inspect.signature(AppleMusicApi.create_from_netscape_cookies)
 wrapper_api_create_sig = inspect.signature(WrapperApi.create)
@@ -145,6 +145,32 @@ class CliConfig:
             is_flag=True,
         ),
     ]
+    url_concurrency: Annotated[
+        int,
+        option(
+            "--url-concurrency",
+            help="Number of URLs to resolve concurrently",
+            default=1,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    deduplicate: Annotated[
+        bool,
+        option(
+            "--deduplicate",
+            help="Resolve and download media appearing in several URLs only once",
+            is_flag=True,
+        ),
+    ]
+    adaptive_concurrency: Annotated[
+        bool,
+        option(
+            "--adaptive-concurrency",
+            help="Adjust metadata and download concurrency at runtime, "
+            "using the configured values as upper bounds",
+            is_flag=True,
+        ),
+    ]
     # Wrapper specific options
     wrapper_url: Annotated[
         str,
@@ -195,6 +221,162 @@ class CliConfig:
             default=api_create_sig.parameters["language"].default,
         ),
     ]
+    catalog_rate_limit: Annotated[
+        float | None,
+        option(
+            "--catalog-rate-limit",
+            help="Maximum catalog API requests per second",
+            default=api_create_sig.parameters["catalog_rate_limit"].default,
+            type=click.FloatRange(min=0, min_open=True),
+        ),
+    ]
+    webplayback_rate_limit: Annotated[
+        float | None,
+        option(
+            "--webplayback-rate-limit",
+            help="Maximum webplayback API requests per second",
+            default=api_create_sig.parameters["webplayback_rate_limit"].default,
+            type=click.FloatRange(min=0, min_open=True),
+        ),
+    ]
+    license_rate_limit: Annotated[
+        float | None,
+        option(
+            "--license-rate-limit",
+            help="Maximum license API requests per second",
+            default=api_create_sig.parameters["license_rate_limit"].default,
+            type=click.FloatRange(min=0, min_open=True),
+        ),
+    ]
+    catalog_batch_window: Annotated[
+        float,
+        option(
+            "--catalog-batch-window",
+            help="Seconds to wait for catalog lookups to batch together (0 to disable)",
+            default=api_create_sig.parameters["catalog_batch_window"].default,
+            type=click.FloatRange(min=0),
+        ),
+    ]
+    max_retries: Annotated[
+        int,
+        option(
+            "--max-retries",
+            help="Max retries for a failed API request or native segment",
+            default=api_create_sig.parameters["max_retries"].default,
+            type=click.IntRange(min=0),
+        ),
+    ]
+    retry_budget_ratio: Annotated[
+        float,
+        option(
+            "--retry-budget-ratio",
+            help="Max retries as a fraction of recent API requests",
+            default=api_create_sig.parameters["retry_budget_ratio"].default,
+            type=click.FloatRange(min=0),
+        ),
+    ]
+    circuit_breaker_threshold: Annotated[
+        int,
+        option(
+            "--circuit-breaker-threshold",
+            help="Consecutive failures before pausing requests to an endpoint",
+            default=api_create_sig.parameters["circuit_breaker_threshold"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    circuit_breaker_timeout: Annotated[
+        float,
+        option(
+            "--circuit-breaker-timeout",
+            help="Seconds to pause an endpoint without a Retry-After header",
+            default=api_create_sig.parameters["circuit_breaker_timeout"].default,
+            type=click.FloatRange(min=0),
+        ),
+    ]
+    response_cache_path: Annotated[
+        str | None,
+        option(
+            "--response-cache-path",
+            help="SQLite file for caching catalog API responses",
+            default=api_create_sig.parameters["response_cache_path"].default,
+            type=click.Path(
+                file_okay=True,
+                dir_okay=False,
+                writable=True,
+                resolve_path=True,
+            ),
+        ),
+    ]
+    response_cache_ttl: Annotated[
+        int,
+        option(
+            "--response-cache-ttl",
+            help="Seconds a cached catalog response is used without revalidation",
+            default=api_create_sig.parameters["response_cache_ttl"].default,
+            type=click.IntRange(min=0),
+        ),
+    ]
+    response_cache_endpoint_ttls: Annotated[
+        dict[str, int] | None,
+        option(
+            "--response-cache-endpoint-ttls",
+            help="Comma-separated per-endpoint TTLs (e.g. albums=86400,playlists=0)",
+            default=api_create_sig.parameters["response_cache_endpoint_ttls"].default,
+            type=KeyValueInt(),
+        ),
+    ]
+    compact_metadata: Annotated[
+        bool,
+        option(
+            "--compact-metadata",
+            help="Keep only the metadata fields gamdl reads to reduce memory usage",
+            is_flag=True,
+        ),
+    ]
+    fast_json: Annotated[
+        bool,
+        option(
+            "--fast-json",
+            help="Decode API responses with orjson",
+            is_flag=True,
+        ),
+    ]
+    token_cache_path: Annotated[
+        str | None,
+        option(
+            "--token-cache-path",
+            help="Developer token cache file path",
+            default=str(Path.home() / ".gamdl" / "token.json"),
+            type=click.Path(
+                file_okay=True,
+                dir_okay=False,
+                writable=True,
+                resolve_path=True,
+            ),
+        ),
+    ]
+    storefront_cache_path: Annotated[
+        str | None,
+        option(
+            "--storefront-cache-path",
+            help="Storefront ID cache file path",
+            default=str(Path.home() / ".gamdl" / "storefronts.json"),
+            type=click.Path(
+                file_okay=True,
+                dir_okay=False,
+                writable=True,
+                resolve_path=True,
+            ),
+        ),
+    ]
+    http2: Annotated[
+        bool,
+        option(
+            "--http2",
+            help="Use HTTP/2 where the server supports it",
+            is_flag=True,
+        ),
+    ]
     # Base Interface specific options
     cover_format: Annotated[
         CoverFormat,
@@ -235,6 +417,63 @@ class CliConfig:
             is_flag=True,
         ),
     ]
+    max_connections: Annotated[
+        int,
+        option(
+            "--max-connections",
+            help="Maximum number of pooled HTTP connections per client",
+            default=base_interface_create_sig.parameters["max_connections"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    max_keepalive_connections: Annotated[
+        int,
+        option(
+            "--max-keepalive-connections",
+            help="Maximum number of idle HTTP connections kept alive per client",
+            default=base_interface_create_sig.parameters[
+                "max_keepalive_connections"
+            ].default,
+            type=click.IntRange(min=0),
+        ),
+    ]
+    keepalive_expiry: Annotated[
+        float,
+        option(
+            "--keepalive-expiry",
+            help="Seconds an idle HTTP connection is kept alive",
+            default=base_interface_create_sig.parameters["keepalive_expiry"].default,
+            type=click.FloatRange(min=0),
+        ),
+    ]
+    # Interface specific options
+    metadata_concurrency: Annotated[
+        int,
+        option(
+            "--metadata-concurrency",
+            help="Number of tracks to resolve metadata for concurrently",
+            default=interface_create_sig.parameters["concurrency"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    prefetch: Annotated[
+        int,
+        option(
+            "--prefetch",
+            help="Number of upcoming tracks to resolve ahead of the download",
+            default=interface_create_sig.parameters["prefetch"].default,
+            type=click.IntRange(min=0),
+        ),
+    ]
+    prefetch_ttl: Annotated[
+        int,
+        option(
+            "--prefetch-ttl",
+            help="Seconds after which prefetched tracks are resolved again",
+            default=interface_create_sig.parameters["prefetch_ttl"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
     # Song Interface Options
     synced_lyrics_format: Annotated[
         SyncedLyricsFormat,
@@ -437,6 +676,51 @@ class CliConfig:
             default=base_downloader_sig.parameters["truncate"].default,
         ),
     ]
+    decrypt_concurrency: Annotated[
+        int | None,
+        option(
+            "--decrypt-concurrency",
+            help="Number of decrypt/mux jobs to run concurrently "
+            "(defaults to CPU count)",
+            default=base_downloader_sig.parameters["decrypt_concurrency"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    native_concurrency: Annotated[
+        int,
+        option(
+            "--native-concurrency",
+            help="Number of segments to fetch concurrently per stream in native mode",
+            default=base_downloader_sig.parameters["native_concurrency"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    resume: Annotated[
+        bool,
+        option(
+            "--resume",
+            help="Keep partial downloads of failed items and resume them later",
+            is_flag=True,
+        ),
+    ]
+    ytdlp_workers: Annotated[
+        int,
+        option(
+            "--ytdlp-workers",
+            help="Number of persistent yt-dlp worker processes",
+            default=base_downloader_sig.parameters["ytdlp_workers"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
+    ytdlp_max_jobs_per_worker: Annotated[
+        int,
+        option(
+            "--ytdlp-max-jobs-per-worker",
+            help="Downloads before a yt-dlp worker process is recycled (0 to disable)",
+            default=base_downloader_sig.parameters["ytdlp_max_jobs_per_worker"].default,
+            type=click.IntRange(min=0),
+        ),
+    ]
     # DownloaderMusicVideo specific options
     music_video_remux_format: Annotated[
         RemuxFormatMusicVideo,
@@ -489,3 +773,12 @@ class CliConfig:
             is_flag=True,
         ),
     ]
+    download_concurrency: Annotated[
+        int,
+        option(
+            "--download-concurrency",
+            help="Number of items to download concurrently",
+            default=downloader_sig.parameters["concurrency"].default,
+            type=click.IntRange(min=1),
+        ),
+    ]
@@ -8,7 +8,7 @@ import click.types as click_types
 
 from .cli_config import CliConfig
 from .constants import EXCLUDED_CONFIG_FILE_PARAMS
-from .utils import Csv
+from .utils import Csv, KeyValueInt
 
 
 class ConfigFile:
@@ -48,6 +48,9 @@ class ConfigFile:
                 for item in param.default
             )
 
+        if isinstance(param.type, KeyValueInt):
+            return ",".join(f"{key}={value}" for key, value in param.default.items())
+
         if isinstance(param.type, click_types.FuncParamType):
             return param.default.value
 
@@ -59,7 +62,8 @@ class ConfigFile:
             click_types.Choice
             | click_types.Path
             | click_types.StringParamType
-            | click_types.IntParamType,
+            | click_types.IntParamType
+            | click_types.FloatParamType,
         ):
             return str(param.default)
 
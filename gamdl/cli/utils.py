@@ -41,6 +41,29 @@ class Csv(click.ParamType):
         return result
 
 
+class KeyValueInt(click.ParamType):
+    name = "key_value_int"
+
+    def convert(
+        self,
+        value: str,
+        param: click.Parameter,
+        ctx: click.Context,
+    ) -> dict[str, int]:
+        if not isinstance(value, str):
+            return value
+
+        result = {}
+
+        for item in (v.strip() for v in value.split(",") if v.strip()):
+            key, separator, item_value = item.partition("=")
+            if not separator or not item_value.strip().isdigit():
+                self.fail(f"'{item}' is not a valid key=integer pair", param, ctx)
+            result[key.strip()] = int(item_value)
+
+        return result
+
+
 class CustomOutputWriter:
     def __init__(
         self,
@@ -4,6 +4,7 @@ from .downloader import AppleMusicDownloader
 from .enums import *
 from .exceptions import *
 from .music_video import AppleMusicMusicVideoDownloader
+from .pipeline import AppleMusicDownloadPipeline
 from .song import AppleMusicSongDownloader
 from .types import *
 from .uploaded_video import AppleMusicUploadedVideoDownloader
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import Executor
+from functools import partial
 
 from .. import _ammuxer
 from ..api.wrapper import WrapperApi
 
 
+async def _run_native(executor: Executor | None, func, *args) -> None:
+    """Run a blocking native call on ``executor`` (the default pool if None)."""
+    await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args))
+
+
 async def decrypt_and_mux_hex(
     decryption_key_audio: str,
     input_audio_path: str,
@@ -18,9 +25,11 @@ async def decrypt_and_mux_hex(
     use_cenc: bool = False,
     use_single_content_key: bool = False,
     m4v_brand: bool = False,
+    executor: Executor | None = None,
 ) -> None:
     """Decrypt local-key media and mux the final file in one Rust call."""
-    await asyncio.to_thread(
+    await _run_native(
+        executor,
         _ammuxer.decrypt_and_mux_hex_native,
         decryption_key_audio,
         input_audio_path,
@@ -44,9 +53,11 @@ async def decrypt_and_mux_wrapper(
     fairplay_key_video: str | None = None,
     use_single_content_key: bool = False,
     m4v_brand: bool = False,
+    executor: Executor | None = None,
 ) -> None:
     """Decrypt wrapper-v2 FairPlay media and mux the final file in one Rust call."""
-    await asyncio.to_thread(
+    await _run_native(
+        executor,
         _ammuxer.decrypt_and_mux_wrapper_native,
         wrapper_api.decrypt_host,
         wrapper_api.decrypt_port,
@@ -1,72 +1,41 @@
 import asyncio
-import multiprocessing
-import queue
+import hashlib
+import os
 import re
 import shutil
-import traceback
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import structlog
 from mutagen.mp4 import MP4, MP4Cover
-from yt_dlp import YoutubeDL
-from yt_dlp.downloader.hls import HlsFD
-from yt_dlp.downloader.http import HttpFD
 
 from ..interface.enums import CoverFormat
 from ..interface.interface import AppleMusicInterface
 from ..interface.types import MediaTags, PlaylistTags
-from ..utils import CustomStringFormatter, async_subprocess
-from .constants import ILLEGAL_CHAR_REPLACEMENT, ILLEGAL_CHARS_RE, TEMP_PATH_TEMPLATE
+from ..utils import (
+    AdaptiveConcurrencyLimiter,
+    CustomStringFormatter,
+    async_subprocess,
+)
+from .constants import (
+    ANSI_ESCAPE_RE,
+    ILLEGAL_CHAR_REPLACEMENT,
+    ILLEGAL_CHARS_RE,
+    NM3U8DLRE_PROGRESS_RE,
+    SIZE_UNITS,
+    TEMP_PATH_TEMPLATE,
+)
 from .enums import DownloadMode
+from .hls import HlsDownloader
+from .manifest import DownloadManifest
+from .types import DownloadItem, DownloadProgress
+from .ytdlp import YtdlpWorkerPool
 
 logger = structlog.get_logger(__name__)
 
 
-def _download_ytdlp_process(
-    stream_url: str,
-    download_path: str,
-    silent: bool,
-    result_queue,
-) -> None:
-    try:
-        Path(download_path).parent.mkdir(parents=True, exist_ok=True)
-
-        with YoutubeDL(
-            {
-                "quiet": True,
-                "no_warnings": True,
-                "overwrites": True,
-                "noprogress": silent,
-                "allow_unplayable_formats": True,
-                "concurrent_fragment_downloads": 8,
-            }
-        ) as ydl:
-            if stream_url.split("?")[0].endswith(".m3u8"):
-                hls_downloader = HlsFD(ydl, ydl.params)
-                success, _ = hls_downloader.download(
-                    download_path,
-                    {
-                        "url": stream_url,
-                        "ext": "mp4",
-                        "protocol": "m3u8",
-                    },
-                )
-                if not success:
-                    raise RuntimeError("yt-dlp HLS download failed")
-            else:
-                http_downloader = HttpFD(ydl, ydl.params)
-                success, _ = http_downloader.download(
-                    download_path,
-                    {
-                        "url": stream_url,
-                    },
-                )
-                if not success:
-                    raise RuntimeError("yt-dlp HTTP download failed")
-    except Exception as e:
-        result_queue.put(("error", repr(e), traceback.format_exc()))
-
-
 class AppleMusicBaseDownloader:
     def __init__(
         self,
@@ -88,6 +57,14 @@ class AppleMusicBaseDownloader:
         exclude_tags: list[str] = None,
         truncate: int = None,
         silent: bool = False,
+        decrypt_concurrency: int | None = None,
+        download_limiter: AdaptiveConcurrencyLimiter | None = None,
+        native_concurrency: int = 8,
+        ytdlp_workers: int = 4,
+        ytdlp_max_jobs_per_worker: int = 50,
+        progress_function: Callable[[DownloadProgress], None] | None = None,
+        resume: bool = False,
+        max_retries: int = 6,
     ):
         self.interface = interface
         self.output_path = output_path
@@ -107,9 +84,41 @@ class AppleMusicBaseDownloader:
         self.exclude_tags = exclude_tags
         self.truncate = truncate
         self.silent = silent
+        self.decrypt_concurrency = decrypt_concurrency or os.cpu_count() or 1
+        self.download_limiter = download_limiter
+        self.native_concurrency = native_concurrency
+        self.ytdlp_workers = ytdlp_workers
+        self.ytdlp_max_jobs_per_worker = ytdlp_max_jobs_per_worker
+        self.progress_function = progress_function
+        self.resume = resume
+        self.max_retries = max_retries
+
+        self._active_temp_tags: set[str] = set()
+
+        self.hls_downloader = HlsDownloader(
+            self.interface.base.playlist_client,
+            self.native_concurrency,
+            self.resume,
+            self.max_retries,
+        )
+        self.ytdlp_pool = YtdlpWorkerPool(
+            self.ytdlp_workers,
+            self.ytdlp_max_jobs_per_worker,
+            self.silent,
+            self.resume,
+        )
+
+        self.decrypt_executor = ThreadPoolExecutor(
+            max_workers=self.decrypt_concurrency,
+            thread_name_prefix="gamdl-decrypt",
+        )
 
         self._initialize_binary_paths()
 
+    async def close(self) -> None:
+        self.decrypt_executor.shutdown(wait=False, cancel_futures=True)
+        await self.ytdlp_pool.close()
+
     def _initialize_binary_paths(self):
         log = logger.bind(action="initialize_binary_paths")
 
@@ -122,6 +131,35 @@ class AppleMusicBaseDownloader:
             full_ffmpeg_path=self.full_ffmpeg_path,
         )
 
+    def get_temp_tag(self, download_item: DownloadItem) -> str:
+        if not self.resume:
+            return download_item.uuid_
+
+        stream_info = download_item.media.stream_info
+        variant = (
+            "|".join(
+                f"{track.codec}:{track.width}x{track.height}:"
+                f"{track.stream_url.split('?')[0] if track.stream_url else None}"
+                for track in (stream_info.video_track, stream_info.audio_track)
+                if track
+            )
+            if stream_info
+            else ""
+        )
+        temp_tag = (
+            f"{download_item.media.media_id}_"
+            f"{hashlib.sha1(variant.encode()).hexdigest()[:8]}"
+        )
+
+        if temp_tag in self._active_temp_tags:
+            return download_item.uuid_
+
+        self._active_temp_tags.add(temp_tag)
+        return temp_tag
+
+    def release_temp_tag(self, temp_tag: str) -> None:
+        self._active_temp_tags.discard(temp_tag)
+
     def get_temp_path(
         self,
         media_id: str,
@@ -249,9 +287,43 @@ class AppleMusicBaseDownloader:
             action="download_stream", stream_url=stream_url, download_path=download_path
         )
 
+        stream_key = stream_url.split("?")[0]
+        if self.resume:
+            manifest = DownloadManifest.load(download_path, stream_key)
+            if manifest and manifest.complete:
+                log.debug("already_downloaded")
+                return
+
+        if self.download_limiter:
+            async with self.download_limiter:
+                await self._download_stream(stream_url, download_path)
+
+            self.download_limiter.record_throughput(
+                Path(download_path).stat().st_size
+            )
+        else:
+            await self._download_stream(stream_url, download_path)
+
+        if self.resume:
+            DownloadManifest(
+                stream_key,
+                downloaded_bytes=Path(download_path).stat().st_size,
+                complete=True,
+            ).save(download_path)
+
+        log.debug("success")
+
+    async def _download_stream(
+        self,
+        stream_url: str,
+        download_path: str,
+    ) -> None:
         stream_url_stripped = stream_url.split("?")[0]
 
-        if (
+        if self.download_mode == DownloadMode.NATIVE:
+            await self._download_native(stream_url, download_path)
+
+        elif (
             self.download_mode == DownloadMode.YTDLP
             or not stream_url_stripped.endswith(".m3u8")
         ):
@@ -263,47 +335,63 @@ class AppleMusicBaseDownloader:
         elif self.download_mode == DownloadMode.NM3U8DLRE:
             await self._download_nm3u8dlre(stream_url, download_path)
 
-        log.debug("success")
+    def _report_progress(self, progress: DownloadProgress) -> None:
+        logger.debug(
+            "progress",
+            action="download_progress",
+            download_path=progress.download_path,
+            downloaded_bytes=progress.downloaded_bytes,
+            total_bytes=progress.total_bytes,
+            fragment_index=progress.fragment_index,
+            fragment_count=progress.fragment_count,
+            speed=progress.speed,
+        )
+
+        if self.progress_function:
+            self.progress_function(progress)
+
+    @staticmethod
+    def parse_nm3u8dlre_progress(
+        line: str,
+        download_path: str,
+    ) -> DownloadProgress | None:
+        match = re.search(NM3U8DLRE_PROGRESS_RE, re.sub(ANSI_ESCAPE_RE, "", line))
+        if not match:
+            return None
+
+        def parse_size(value: str | None, unit: str | None) -> int | None:
+            if value is None:
+                return None
+            return int(float(value) * SIZE_UNITS[unit])
+
+        return DownloadProgress(
+            download_path,
+            downloaded_bytes=(
+                parse_size(match["downloaded"], match["downloaded_unit"]) or 0
+            ),
+            total_bytes=parse_size(match["total"], match["total_unit"]),
+            fragment_index=int(match["fragment_index"]),
+            fragment_count=int(match["fragment_count"]),
+            speed=parse_size(match["speed"], match["speed_unit"]),
+        )
+
+    async def _download_native(self, stream_url: str, download_path: str) -> None:
+        await self.hls_downloader.download(
+            stream_url,
+            download_path,
+            self._report_progress,
+        )
 
     async def _download_ytdlp_async(
         self,
         stream_url: str,
         download_path: str,
     ) -> None:
-        ctx = multiprocessing.get_context()
-        result_queue = ctx.Queue()
-        process = ctx.Process(
-            target=_download_ytdlp_process,
-            args=(stream_url, download_path, self.silent, result_queue),
+        await self.ytdlp_pool.download(
+            stream_url,
+            download_path,
+            self._report_progress,
         )
-        process.start()
-
-        try:
-            while process.is_alive():
-                await asyncio.sleep(0.1)
-
-            process.join()
-
-            try:
-                status, error_repr, error_traceback = result_queue.get_nowait()
-            except queue.Empty:
-                status = None
-
-            if status == "error":
-                raise RuntimeError(
-                    f"yt-dlp failed: {error_repr}\n{error_traceback}"
-                ) from None
-
-            if process.exitcode != 0:
-                raise RuntimeError(f"yt-dlp exited with code {process.exitcode}")
-        finally:
-            if process.is_alive():
-                process.terminate()
-                await asyncio.to_thread(process.join, 5)
-                if process.is_alive():
-                    process.kill()
-                    await asyncio.to_thread(process.join)
-            process.close()
 
     async def _download_nm3u8dlre(self, stream_url: str, download_path: str):
         download_path_obj = Path(download_path)
@@ -325,8 +413,14 @@ class AppleMusicBaseDownloader:
             "--tmp-dir",
             download_path_obj.parent,
             silent=self.silent,
+            output_function=partial(self._report_nm3u8dlre_progress, download_path),
         )
 
+    def _report_nm3u8dlre_progress(self, download_path: str, line: str) -> None:
+        progress = self.parse_nm3u8dlre_progress(line, download_path)
+        if progress:
+            self._report_progress(progress)
+
     async def apply_tags(
         self,
         media_path: str,
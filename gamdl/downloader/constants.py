@@ -1,3 +1,11 @@
 TEMP_PATH_TEMPLATE = "gamdl_temp_{}"
 ILLEGAL_CHARS_RE = r'[\\/:*?"<>|;]'
 ILLEGAL_CHAR_REPLACEMENT = "_"
+NM3U8DLRE_PROGRESS_RE = (
+    r"(?P<fragment_index>\d+)/(?P<fragment_count>\d+)\s+[\d.]+%"
+    r"(?:\s+(?P<downloaded>[\d.]+)(?P<downloaded_unit>[KMGT]?B)"
+    r"/(?P<total>[\d.]+)(?P<total_unit>[KMGT]?B))?"
+    r"(?:\s+(?P<speed>[\d.]+)(?P<speed_unit>[KMGT]?B)ps)?"
+)
+ANSI_ESCAPE_RE = r"\x1b\[[0-9;?]*[A-Za-z]"
+SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
@@ -1,3 +1,5 @@
+import asyncio
+import os
 import shutil
 from pathlib import Path
 from typing import AsyncGenerator
@@ -33,6 +35,8 @@ class AppleMusicDownloader:
         synced_lyrics_only: bool = False,
         skip_cleanup: bool = False,
         skip_processing: bool = False,
+        concurrency: int = 1,
+        deduplicate: bool = False,
     ):
         self.song = song
         self.music_video = music_video
@@ -44,9 +48,14 @@ class AppleMusicDownloader:
         self.synced_lyrics_only = synced_lyrics_only
         self.skip_cleanup = skip_cleanup
         self.skip_processing = skip_processing
+        self.concurrency = concurrency
+        self.deduplicate = deduplicate
 
         self.base = song.base
 
+        self._downloaded_media: dict[str, asyncio.Future[str]] = {}
+        self._pending_downloads: dict[str, asyncio.Future[str]] = {}
+
     async def get_download_item_from_url(
         self,
         url: str,
@@ -77,19 +86,121 @@ class AppleMusicDownloader:
             return await self.uploaded_video.get_download_item(media)
 
     async def download(self, item: DownloadItem) -> None:
+        failed = False
         try:
-            if item.media.error:
-                raise item.media.error
-
-            if item.media.partial:
+            if not await self.prepare(item):
                 return
 
-            await self._initial_processing(item)
-            await self._download(item)
-            await self._final_processing(item)
+            await self.fetch(item)
+            await self.decrypt(item)
+            await self.tag(item)
+            await self.finalize(item)
+        except BaseException:
+            failed = True
+            raise
         finally:
-            if not self.skip_cleanup:
-                self._cleanup_temp(item.uuid_)
+            self.release(item, failed)
+
+    async def prepare(self, item: DownloadItem) -> bool:
+        if item.media.error:
+            raise item.media.error
+
+        if item.media.partial:
+            return False
+
+        await self._initial_processing(item)
+
+        if self.deduplicate:
+            if await self._reuse_downloaded_media(item):
+                return False
+
+            downloaded_media_future = asyncio.get_running_loop().create_future()
+            self._downloaded_media[item.media.media_id] = downloaded_media_future
+            self._pending_downloads[item.uuid_] = downloaded_media_future
+
+        self._check_download(item)
+
+        return True
+
+    async def fetch(self, item: DownloadItem) -> None:
+        await self._get_media_downloader(item).fetch(item)
+
+    async def decrypt(self, item: DownloadItem) -> None:
+        await self._get_media_downloader(item).decrypt(item)
+
+    async def tag(self, item: DownloadItem) -> None:
+        await self._get_media_downloader(item).tag(item)
+
+    async def finalize(self, item: DownloadItem) -> None:
+        await self._final_processing(item)
+
+        downloaded_media_future = self._pending_downloads.pop(item.uuid_, None)
+        if downloaded_media_future is not None:
+            downloaded_media_future.set_result(item.final_path)
+
+    def release(self, item: DownloadItem, failed: bool = False) -> None:
+        downloaded_media_future = self._pending_downloads.pop(item.uuid_, None)
+        if downloaded_media_future is not None and not downloaded_media_future.done():
+            downloaded_media_future.cancel()
+            self.base.interface.invalidate_resolved_media(item.media.media_id)
+            if (
+                self._downloaded_media.get(item.media.media_id)
+                is downloaded_media_future
+            ):
+                del self._downloaded_media[item.media.media_id]
+
+        if item.temp_tag:
+            self.base.release_temp_tag(item.temp_tag)
+
+        if not self.skip_cleanup and not (failed and self.base.resume):
+            self._cleanup_temp(item.temp_tag or item.uuid_)
+
+    async def _reuse_downloaded_media(self, item: DownloadItem) -> bool:
+        log = logger.bind(
+            action="reuse_downloaded_media",
+            media_id=item.media.media_id,
+        )
+
+        downloaded_media_future = self._downloaded_media.get(item.media.media_id)
+        if downloaded_media_future is None:
+            return False
+
+        await asyncio.wait({downloaded_media_future})
+        if downloaded_media_future.cancelled():
+            log.debug("first_download_failed")
+            return False
+
+        downloaded_path = downloaded_media_future.result()
+        if not downloaded_path or not Path(downloaded_path).exists():
+            log.debug("downloaded_path_missing", downloaded_path=downloaded_path)
+            return False
+
+        if Path(item.final_path) != Path(downloaded_path) and (
+            self.overwrite or not Path(item.final_path).exists()
+        ):
+            self._link_to_final_path(downloaded_path, item.final_path)
+
+        log.debug("success", downloaded_path=downloaded_path)
+
+        return True
+
+    def _link_to_final_path(self, downloaded_path: str, final_path: str) -> None:
+        log = logger.bind(
+            action="link_to_final_path",
+            downloaded_path=downloaded_path,
+            final_path=final_path,
+        )
+
+        final_path_obj = Path(final_path)
+        final_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        final_path_obj.unlink(missing_ok=True)
+
+        try:
+            os.link(downloaded_path, final_path)
+        except OSError:
+            shutil.copy2(downloaded_path, final_path)
+
+        log.debug("success")
 
     def _update_playlist_file(
         self,
@@ -186,39 +297,44 @@ class AppleMusicDownloader:
                 item.media.lyrics.synced,
             )
 
-    async def _download(self, item: DownloadItem) -> None:
-        if item.media.error:
-            raise item.media.error
-
+    def _check_download(self, item: DownloadItem) -> None:
         if self.synced_lyrics_only:
             raise GamdlDownloaderSyncedLyricsOnlyError()
 
         if Path(item.final_path).exists() and not self.overwrite:
             raise GamdlDownloaderMediaFileExistsError(item.final_path)
 
-        if item.media.media_metadata["type"] in {
+        if (
+            item.media.media_metadata["type"]
+            in {
+                "music-videos",
+                "library-music-videos",
+                "songs",
+                "library-songs",
+            }
+            and self.base.download_mode == DownloadMode.NM3U8DLRE
+            and not self.base.full_nm3u8dlre_path
+        ):
+            raise GamdlDownloaderDependencyNotFoundError("N_m3u8DL-RE")
+
+    def _get_media_downloader(
+        self,
+        item: DownloadItem,
+    ) -> (
+        AppleMusicSongDownloader
+        | AppleMusicMusicVideoDownloader
+        | AppleMusicUploadedVideoDownloader
+    ):
+        if item.media.media_metadata["type"] in {"songs", "library-songs"}:
+            return self.song
+
+        elif item.media.media_metadata["type"] in {
             "music-videos",
             "library-music-videos",
-            "songs",
-            "library-songs",
         }:
-            if (
-                self.base.download_mode == DownloadMode.NM3U8DLRE
-                and not self.base.full_nm3u8dlre_path
-            ):
-                raise GamdlDownloaderDependencyNotFoundError("N_m3u8DL-RE")
-
-            if item.media.media_metadata["type"] in {"songs", "library-songs"}:
-                await self.song.download(item)
-
-            elif item.media.media_metadata["type"] in {
-                "music-videos",
-                "library-music-videos",
-            }:
-                await self.music_video.download(item)
+            return self.music_video
 
-        elif item.media.media_metadata["type"] in {"uploaded-videos"}:
-            await self.uploaded_video.download(item)
+        return self.uploaded_video
 
     def _move_to_final_path(self, staged_path: str, final_path: str) -> None:
         log = logger.bind(
@@ -4,6 +4,7 @@ from enum import Enum
 class DownloadMode(Enum):
     YTDLP = "ytdlp"
     NM3U8DLRE = "nm3u8dlre"
+    NATIVE = "native"
 
 
 class RemuxMode(Enum):
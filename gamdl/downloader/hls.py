@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import httpx
+import m3u8
+import structlog
+
+from ..api.transport import THROTTLE_STATUS_CODES, get_retry_after
+from .manifest import DownloadManifest
+from .types import DownloadProgress
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class HlsPart:
+    url: str
+    start: int | None = None
+    end: int | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if self.start is None:
+            return {}
+
+        return {"range": f"bytes={self.start}-{self.end}"}
+
+
+class HlsDownloader:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        concurrency: int = 8,
+        resume: bool = False,
+        max_retries: int = 6,
+        backoff_factor: float = 1.0,
+    ) -> None:
+        self.client = client
+        self.concurrency = concurrency
+        self.resume = resume
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+    @staticmethod
+    def get_parts(m3u8_obj: m3u8.M3U8) -> list[HlsPart]:
+        parts = []
+        next_offsets: dict[str, int] = {}
+
+        def add_part(url: str, byterange: str | None) -> None:
+            if not byterange:
+                parts.append(HlsPart(url))
+                return
+
+            length, _, offset = byterange.partition("@")
+            start = int(offset) if offset else next_offsets.get(url, 0)
+            end = start + int(length) - 1
+            next_offsets[url] = end + 1
+            parts.append(HlsPart(url, start, end))
+
+        init_section = None
+        for segment in m3u8_obj.segments:
+            if segment.init_section and (
+                segment.init_section.absolute_uri,
+                segment.init_section.byterange,
+            ) != init_section:
+                init_section = (
+                    segment.init_section.absolute_uri,
+                    segment.init_section.byterange,
+                )
+                add_part(*init_section)
+
+            add_part(segment.absolute_uri, segment.byterange)
+
+        return parts
+
+    @staticmethod
+    def get_parts_signature(parts: list[HlsPart]) -> str:
+        return hashlib.sha1(
+            "\n".join(
+                f"{part.url.split('?')[0]} {part.start} {part.end}" for part in parts
+            ).encode()
+        ).hexdigest()
+
+    def _load_manifest(
+        self,
+        stream_url: str,
+        download_path: str,
+        parts_signature: str | None = None,
+    ) -> DownloadManifest:
+        stream_key = stream_url.split("?")[0]
+        manifest = (
+            DownloadManifest.load(download_path, stream_key) if self.resume else None
+        )
+        if manifest is None or manifest.parts_signature != parts_signature:
+            manifest = DownloadManifest(stream_key, parts_signature)
+
+        return manifest
+
+    def _save_manifest(
+        self,
+        manifest: DownloadManifest,
+        download_path: str,
+        file,
+    ) -> None:
+        if not self.resume:
+            return
+
+        file.flush()
+        manifest.save(download_path)
+
+    async def get_media_playlist(self, stream_url: str) -> m3u8.M3U8:
+        response = await self.client.get(stream_url, follow_redirects=True)
+        response.raise_for_status()
+        m3u8_obj = m3u8.loads(response.text, uri=stream_url)
+
+        if m3u8_obj.is_variant:
+            playlist = max(
+                m3u8_obj.playlists,
+                key=lambda playlist: playlist.stream_info.bandwidth or 0,
+            )
+            return await self.get_media_playlist(playlist.absolute_uri)
+
+        return m3u8_obj
+
+    async def _fetch_part(self, part: HlsPart) -> bytes:
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                response = await self.client.get(
+                    part.url,
+                    headers=part.headers,
+                    follow_redirects=True,
+                )
+                if (
+                    response.status_code not in THROTTLE_STATUS_CODES
+                    or attempt >= self.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.content
+
+                retry_after = get_retry_after(response)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+
+            attempt += 1
+            logger.debug(
+                "retry",
+                action="hls_fetch_part",
+                url=part.url,
+                attempt=attempt,
+            )
+            await asyncio.sleep(
+                retry_after
+                if retry_after is not None
+                else random.uniform(0, self.backoff_factor * 2 ** (attempt - 1))
+            )
+
+    async def download(
+        self,
+        stream_url: str,
+        download_path: str,
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+    ) -> None:
+        log = logger.bind(
+            action="hls_download",
+            stream_url=stream_url,
+            download_path=download_path,
+        )
+
+        Path(download_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if not stream_url.split("?")[0].endswith(".m3u8"):
+            await self._download_file(stream_url, download_path, progress_callback)
+            log.debug("success")
+            return
+
+        parts = self.get_parts(await self.get_media_playlist(stream_url))
+        manifest = self._load_manifest(
+            stream_url,
+            download_path,
+            self.get_parts_signature(parts),
+        )
+        if manifest.completed_parts:
+            log.debug(
+                "resuming",
+                completed_parts=manifest.completed_parts,
+                downloaded_bytes=manifest.downloaded_bytes,
+            )
+
+        pending: deque[asyncio.Task] = deque()
+        progress = DownloadProgress(
+            download_path,
+            downloaded_bytes=manifest.downloaded_bytes,
+            total_bytes=(
+                sum(part.end - part.start + 1 for part in parts)
+                if all(part.start is not None for part in parts)
+                else None
+            ),
+            fragment_index=manifest.completed_parts,
+            fragment_count=len(parts),
+        )
+        downloaded_at_start = manifest.downloaded_bytes
+        started = time.monotonic()
+        last_saved = started
+
+        async def write_next(file) -> None:
+            nonlocal last_saved
+            content = await pending.popleft()
+            file.write(content)
+            manifest.completed_parts += 1
+            manifest.downloaded_bytes += len(content)
+            if time.monotonic() - last_saved >= 1.0:
+                self._save_manifest(manifest, download_path, file)
+                last_saved = time.monotonic()
+
+            progress.fragment_index = manifest.completed_parts
+            progress.downloaded_bytes = manifest.downloaded_bytes
+            progress.speed = (progress.downloaded_bytes - downloaded_at_start) / max(
+                time.monotonic() - started, 1e-6
+            )
+            if progress_callback:
+                progress_callback(replace(progress))
+
+        try:
+            with open(
+                download_path,
+                "r+b" if manifest.completed_parts else "wb",
+            ) as file:
+                file.seek(manifest.downloaded_bytes)
+                file.truncate()
+
+                try:
+                    for part in parts[manifest.completed_parts :]:
+                        if len(pending) >= self.concurrency:
+                            await write_next(file)
+                        pending.append(asyncio.create_task(self._fetch_part(part)))
+
+                    while pending:
+                        await write_next(file)
+                finally:
+                    self._save_manifest(manifest, download_path, file)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        log.debug("success", parts=len(parts), size=progress.downloaded_bytes)
+
+    async def _download_file(
+        self,
+        url: str,
+        download_path: str,
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+    ) -> None:
+        manifest = self._load_manifest(url, download_path)
+        started = time.monotonic()
+        last_saved = started
+
+        async with self.client.stream(
+            "GET",
+            url,
+            headers=(
+                {"range": f"bytes={manifest.downloaded_bytes}-"}
+                if manifest.downloaded_bytes
+                else {}
+            ),
+            follow_redirects=True,
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                manifest.downloaded_bytes = 0
+
+            downloaded_at_start = manifest.downloaded_bytes
+            content_length = int(response.headers.get("content-length", 0))
+            progress = DownloadProgress(
+                download_path,
+                downloaded_bytes=manifest.downloaded_bytes,
+                total_bytes=(
+                    manifest.downloaded_bytes + content_length
+                    if content_length
+                    else None
+                ),
+            )
+
+            with open(
+                download_path,
+                "r+b" if manifest.downloaded_bytes else "wb",
+            ) as file:
+                file.seek(manifest.downloaded_bytes)
+                file.truncate()
+
+                try:
+                    async for chunk in response.aiter_bytes():
+                        file.write(chunk)
+                        manifest.downloaded_bytes += len(chunk)
+                        if time.monotonic() - last_saved >= 1.0:
+                            self._save_manifest(manifest, download_path, file)
+                            last_saved = time.monotonic()
+
+                        progress.downloaded_bytes = manifest.downloaded_bytes
+                        progress.speed = (
+                            progress.downloaded_bytes - downloaded_at_start
+                        ) / max(time.monotonic() - started, 1e-6)
+                        if progress_callback:
+                            progress_callback(replace(progress))
+                finally:
+                    self._save_manifest(manifest, download_path, file)
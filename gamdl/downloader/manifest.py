@@ -0,0 +1,64 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class DownloadManifest:
+    stream_url: str
+    parts_signature: str | None = None
+    completed_parts: int = 0
+    downloaded_bytes: int = 0
+    complete: bool = False
+
+    @staticmethod
+    def get_path(download_path: str) -> Path:
+        return Path(download_path + ".manifest.json")
+
+    @classmethod
+    def load(
+        cls,
+        download_path: str,
+        stream_url: str,
+    ) -> "DownloadManifest | None":
+        log = logger.bind(action="load_download_manifest", download_path=download_path)
+
+        try:
+            manifest = cls(
+                **json.loads(cls.get_path(download_path).read_text(encoding="utf-8"))
+            )
+        except (OSError, TypeError, ValueError):
+            log.debug("not_found")
+            return None
+
+        if manifest.stream_url != stream_url:
+            log.debug("stream_changed")
+            return None
+
+        if not Path(download_path).exists() or (
+            Path(download_path).stat().st_size < manifest.downloaded_bytes
+        ):
+            log.debug("file_truncated")
+            return None
+
+        log.debug(
+            "success",
+            completed_parts=manifest.completed_parts,
+            downloaded_bytes=manifest.downloaded_bytes,
+            complete=manifest.complete,
+        )
+
+        return manifest
+
+    def save(self, download_path: str) -> None:
+        manifest_path = self.get_path(download_path)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        temp_path.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        os.replace(temp_path, manifest_path)
@@ -1,5 +1,8 @@
+import asyncio
 from pathlib import Path
 
+import structlog
+
 from ..interface.enums import CoverFormat
 from ..interface.types import AppleMusicMedia, DecryptionKeyAv
 from .ammuxer import decrypt_and_mux_hex
@@ -7,6 +10,8 @@ from .base import AppleMusicBaseDownloader
 from .enums import RemuxFormatMusicVideo, RemuxMode
 from .types import DownloadItem
 
+logger = structlog.get_logger(__name__)
+
 
 class AppleMusicMusicVideoDownloader:
     def __init__(
@@ -32,6 +37,7 @@ class AppleMusicMusicVideoDownloader:
             decryption_key.video_track.key,
             encrypted_path_video,
             m4v_brand=is_m4v,
+            executor=self.base.decrypt_executor,
         )
 
     def get_cover_path(
@@ -46,10 +52,11 @@ class AppleMusicMusicVideoDownloader:
         media: AppleMusicMedia,
     ) -> DownloadItem:
         download_item = DownloadItem(media)
+        download_item.temp_tag = self.base.get_temp_tag(download_item)
 
         download_item.staged_path = self.base.get_temp_path(
             media.media_metadata["id"],
-            download_item.uuid_,
+            download_item.temp_tag,
             "staged",
             "." + media.stream_info.file_format.value,
         )
@@ -72,30 +79,71 @@ class AppleMusicMusicVideoDownloader:
 
         return download_item
 
-    async def download(
-        self,
-        download_item: DownloadItem,
-    ) -> None:
+    def get_encrypted_paths(self, download_item: DownloadItem) -> tuple[str, str]:
         encrypted_path_video = self.base.get_temp_path(
             download_item.media.media_metadata["id"],
-            download_item.uuid_,
+            download_item.temp_tag,
             "encrypted_video",
             ".mp4",
         )
         encrypted_path_audio = self.base.get_temp_path(
             download_item.media.media_metadata["id"],
-            download_item.uuid_,
+            download_item.temp_tag,
             "encrypted_audio",
             ".m4a",
         )
 
-        await self.base.download_stream(
-            download_item.media.stream_info.video_track.stream_url,
-            encrypted_path_video,
+        return encrypted_path_video, encrypted_path_audio
+
+    async def fetch(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        encrypted_path_video, encrypted_path_audio = self.get_encrypted_paths(
+            download_item
         )
-        await self.base.download_stream(
-            download_item.media.stream_info.audio_track.stream_url,
-            encrypted_path_audio,
+
+        log = logger.bind(
+            action="fetch_music_video",
+            media_id=download_item.media.media_id,
+        )
+
+        download_tasks = [
+            asyncio.create_task(
+                self.base.download_stream(
+                    download_item.media.stream_info.video_track.stream_url,
+                    encrypted_path_video,
+                )
+            ),
+            asyncio.create_task(
+                self.base.download_stream(
+                    download_item.media.stream_info.audio_track.stream_url,
+                    encrypted_path_audio,
+                )
+            ),
+        ]
+        try:
+            await asyncio.gather(*download_tasks)
+        finally:
+            for download_task in download_tasks:
+                download_task.cancel()
+            await asyncio.gather(*download_tasks, return_exceptions=True)
+
+        video_size = Path(encrypted_path_video).stat().st_size
+        audio_size = Path(encrypted_path_audio).stat().st_size
+        log.debug(
+            "success",
+            video_size=video_size,
+            audio_size=audio_size,
+            total_size=video_size + audio_size,
+        )
+
+    async def decrypt(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        encrypted_path_video, encrypted_path_audio = self.get_encrypted_paths(
+            download_item
         )
 
         await self.stage(
@@ -106,6 +154,10 @@ class AppleMusicMusicVideoDownloader:
             download_item.staged_path.endswith(".m4v"),
         )
 
+    async def tag(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
         cover_bytes = (
             await self.base.interface.base.get_cover_bytes(
                 download_item.media.cover.url
@@ -118,3 +170,11 @@ class AppleMusicMusicVideoDownloader:
             download_item.media.tags,
             cover_bytes,
         )
+
+    async def download(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        await self.fetch(download_item)
+        await self.decrypt(download_item)
+        await self.tag(download_item)
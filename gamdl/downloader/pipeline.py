@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import structlog
+
+from .downloader import AppleMusicDownloader
+from .types import DownloadItem
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(eq=False)
+class _PipelineJob:
+    item: DownloadItem
+    future: asyncio.Future
+
+
+class AppleMusicDownloadPipeline:
+    def __init__(
+        self,
+        downloader: AppleMusicDownloader,
+        tag_concurrency: int = 1,
+    ):
+        self.downloader = downloader
+        self.tag_concurrency = tag_concurrency
+
+        self._stages: list[
+            tuple[str, Callable[[DownloadItem], Awaitable[bool | None]], int]
+        ] = [
+            ("fetch", self._prepare_and_fetch, downloader.concurrency),
+            ("decrypt", downloader.decrypt, downloader.base.decrypt_concurrency),
+            ("tag", downloader.tag, tag_concurrency),
+            ("finalize", downloader.finalize, 1),
+        ]
+        self._queues = [
+            asyncio.Queue(maxsize=concurrency) for _, _, concurrency in self._stages
+        ]
+        self._workers: list[asyncio.Task] = []
+        self._jobs: set[_PipelineJob] = set()
+
+    async def __aenter__(self) -> "AppleMusicDownloadPipeline":
+        self.start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        for stage_index, (stage_name, _, concurrency) in enumerate(self._stages):
+            for _ in range(concurrency):
+                self._workers.append(
+                    asyncio.create_task(
+                        self._run_stage(stage_index),
+                        name=f"gamdl-{stage_name}",
+                    )
+                )
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        for job in list(self._jobs):
+            self._finish(job, asyncio.CancelledError())
+
+    async def submit(self, item: DownloadItem) -> asyncio.Future:
+        job = _PipelineJob(item, asyncio.get_running_loop().create_future())
+        await self._queues[0].put(job)
+        self._jobs.add(job)
+        return job.future
+
+    async def _prepare_and_fetch(self, item: DownloadItem) -> bool:
+        if not await self.downloader.prepare(item):
+            return False
+
+        await self.downloader.fetch(item)
+        return True
+
+    async def _run_stage(self, stage_index: int) -> None:
+        stage_name, stage, _ = self._stages[stage_index]
+        input_queue = self._queues[stage_index]
+        output_queue = (
+            self._queues[stage_index + 1]
+            if stage_index + 1 < len(self._queues)
+            else None
+        )
+
+        while True:
+            job = await input_queue.get()
+            log = logger.bind(
+                action=f"pipeline_{stage_name}",
+                media_id=job.item.media.media_id,
+            )
+
+            try:
+                proceed = await stage(job.item)
+            except Exception as e:
+                log.debug("failed", error=repr(e))
+                self._finish(job, e)
+                continue
+            finally:
+                input_queue.task_done()
+
+            log.debug("success")
+
+            if proceed is False or output_queue is None:
+                self._finish(job)
+            else:
+                await output_queue.put(job)
+
+    def _finish(
+        self,
+        job: _PipelineJob,
+        exception: BaseException | None = None,
+    ) -> None:
+        self._jobs.discard(job)
+
+        try:
+            self.downloader.release(job.item, exception is not None)
+        except Exception as e:
+            exception = exception or e
+
+        if job.future.done():
+            return
+
+        if isinstance(exception, asyncio.CancelledError):
+            job.future.cancel()
+        elif exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(None)
@@ -20,11 +20,12 @@ class AppleMusicSongDownloader:
 
     async def get_download_item(self, media: AppleMusicMedia) -> DownloadItem:
         download_item = DownloadItem(media)
+        download_item.temp_tag = self.base.get_temp_tag(download_item)
 
         if media.stream_info:
             download_item.staged_path = self.base.get_temp_path(
                 media.media_metadata["id"],
-                download_item.uuid_,
+                download_item.temp_tag,
                 "staged",
                 "." + media.stream_info.file_format.value,
             )
@@ -70,6 +71,7 @@ class AppleMusicSongDownloader:
             output_path,
             fairplay_key_audio=fairplay_key,
             use_single_content_key=use_single_content_key,
+            executor=self.base.decrypt_executor,
         )
 
     async def _decrypt_ammuxer_hex(
@@ -87,6 +89,7 @@ class AppleMusicSongDownloader:
             output_path,
             use_cenc=use_cenc,
             use_single_content_key=use_single_content_key,
+            executor=self.base.decrypt_executor,
         )
 
     async def stage(
@@ -107,7 +110,7 @@ class AppleMusicSongDownloader:
         )
 
         if decryption_key:
-            await self._decrypt_ammuxer_hex(
+            await self._decrypt_ammuxer_hex(
                 encrypted_path,
                 staged_path,
                 decryption_key.audio_track.key,
@@ -115,7 +118,7 @@ class AppleMusicSongDownloader:
                 use_single_content_key=use_single_content_key,
             )
         else:
-            await self._decrypt_ammuxer(
+            await self._decrypt_ammuxer(
                 encrypted_path,
                 staged_path,
                 media_id,
@@ -155,7 +158,15 @@ class AppleMusicSongDownloader:
 
         return cover_path
 
-    async def download(
+    def get_encrypted_path(self, download_item: DownloadItem) -> str:
+        return self.base.get_temp_path(
+            download_item.media.media_metadata["id"],
+            download_item.temp_tag,
+            "encrypted",
+            ".m4a",
+        )
+
+    async def fetch(
         self,
         download_item: DownloadItem,
     ) -> None:
@@ -165,27 +176,32 @@ class AppleMusicSongDownloader:
                 download_item.staged_path,
             )
         else:
-            encrypted_path = self.base.get_temp_path(
-                download_item.media.media_metadata["id"],
-                download_item.uuid_,
-                "encrypted",
-                ".m4a",
-            )
             await self.base.download_stream(
                 download_item.media.stream_info.audio_track.stream_url,
-                encrypted_path,
+                self.get_encrypted_path(download_item),
             )
 
-            await self.stage(
-                encrypted_path,
-                download_item.staged_path,
-                download_item.media.media_id,
-                download_item.media.decryption_key,
-                download_item.media.stream_info.audio_track.fairplay_key,
-                download_item.media.stream_info.audio_track.use_cenc,
-                download_item.media.stream_info.audio_track.use_single_content_key,
-            )
+    async def decrypt(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        if download_item.media.stream_info.audio_track.drm_free:
+            return
+
+        await self.stage(
+            self.get_encrypted_path(download_item),
+            download_item.staged_path,
+            download_item.media.media_id,
+            download_item.media.decryption_key,
+            download_item.media.stream_info.audio_track.fairplay_key,
+            download_item.media.stream_info.audio_track.use_cenc,
+            download_item.media.stream_info.audio_track.use_single_content_key,
+        )
 
+    async def tag(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
         cover_bytes = (
             await self.base.interface.base.get_cover_bytes(
                 download_item.media.cover.url
@@ -198,3 +214,11 @@ class AppleMusicSongDownloader:
             download_item.media.tags,
             cover_bytes,
         )
+
+    async def download(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        await self.fetch(download_item)
+        await self.decrypt(download_item)
+        await self.tag(download_item)
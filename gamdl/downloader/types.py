@@ -8,8 +8,29 @@ from ..interface.types import AppleMusicMedia
 class DownloadItem:
     media: AppleMusicMedia
     uuid_: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    temp_tag: str = None
     staged_path: str = None
     final_path: str = None
     playlist_file_path: str = None
     synced_lyrics_path: str = None
     cover_path: str = None
+
+
+@dataclass
+class DownloadProgress:
+    download_path: str
+    downloaded_bytes: int = 0
+    total_bytes: int | None = None
+    fragment_index: int | None = None
+    fragment_count: int | None = None
+    speed: float | None = None
+
+    @property
+    def fraction(self) -> float | None:
+        if self.fragment_count:
+            return (self.fragment_index or 0) / self.fragment_count
+
+        if self.total_bytes:
+            return self.downloaded_bytes / self.total_bytes
+
+        return None
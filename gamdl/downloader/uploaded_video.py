@@ -21,10 +21,11 @@ class AppleMusicUploadedVideoDownloader:
         media: AppleMusicMedia,
     ) -> DownloadItem:
         download_item = DownloadItem(media)
+        download_item.temp_tag = self.base.get_temp_tag(download_item)
 
         download_item.staged_path = self.base.get_temp_path(
             media.media_metadata["id"],
-            download_item.uuid_,
+            download_item.temp_tag,
             "staged",
             "." + media.stream_info.file_format.value,
         )
@@ -42,7 +43,7 @@ class AppleMusicUploadedVideoDownloader:
 
         return download_item
 
-    async def download(
+    async def fetch(
         self,
         download_item: DownloadItem,
     ) -> None:
@@ -51,6 +52,16 @@ class AppleMusicUploadedVideoDownloader:
             download_item.staged_path,
         )
 
+    async def decrypt(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        pass
+
+    async def tag(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
         cover_bytes = (
             await self.base.interface.base.get_cover_bytes(
                 download_item.media.cover.url
@@ -63,3 +74,11 @@ class AppleMusicUploadedVideoDownloader:
             download_item.media.tags,
             cover_bytes,
         )
+
+    async def download(
+        self,
+        download_item: DownloadItem,
+    ) -> None:
+        await self.fetch(download_item)
+        await self.decrypt(download_item)
+        await self.tag(download_item)
@@ -0,0 +1,295 @@
+import asyncio
+import itertools
+import multiprocessing
+import threading
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import structlog
+from yt_dlp import YoutubeDL
+from yt_dlp.downloader.hls import HlsFD
+from yt_dlp.downloader.http import HttpFD
+
+from .types import DownloadProgress
+
+logger = structlog.get_logger(__name__)
+
+
+def _ytdlp_worker_process(
+    silent: bool,
+    resume: bool,
+    max_jobs: int,
+    job_queue,
+    result_queue,
+) -> None:
+    with YoutubeDL(
+        {
+            "quiet": True,
+            "no_warnings": True,
+            "overwrites": not resume,
+            "continuedl": resume,
+            "noprogress": silent,
+            "allow_unplayable_formats": True,
+            "concurrent_fragment_downloads": 8,
+        }
+    ) as ydl:
+        for _ in range(max_jobs) if max_jobs else itertools.count():
+            job = job_queue.get()
+            if job is None:
+                return
+
+            job_id, stream_url, download_path = job
+
+            def progress_hook(status: dict) -> None:
+                total_bytes = status.get("total_bytes") or status.get(
+                    "total_bytes_estimate"
+                )
+                result_queue.put(
+                    (
+                        job_id,
+                        "progress",
+                        {
+                            "downloaded_bytes": status.get("downloaded_bytes") or 0,
+                            "total_bytes": int(total_bytes) if total_bytes else None,
+                            "fragment_index": status.get("fragment_index"),
+                            "fragment_count": status.get("fragment_count"),
+                            "speed": status.get("speed"),
+                        },
+                    )
+                )
+
+            try:
+                Path(download_path).parent.mkdir(parents=True, exist_ok=True)
+
+                if stream_url.split("?")[0].endswith(".m3u8"):
+                    downloader = HlsFD(ydl, ydl.params)
+                    info = {
+                        "url": stream_url,
+                        "ext": "mp4",
+                        "protocol": "m3u8",
+                    }
+                else:
+                    downloader = HttpFD(ydl, ydl.params)
+                    info = {
+                        "url": stream_url,
+                    }
+
+                downloader.add_progress_hook(progress_hook)
+                success, _ = downloader.download(download_path, info)
+                if not success:
+                    raise RuntimeError("yt-dlp download failed")
+            except Exception as e:
+                result_queue.put((job_id, "error", (repr(e), traceback.format_exc())))
+            else:
+                result_queue.put((job_id, "success", None))
+
+
+@dataclass
+class _YtdlpWorker:
+    process: multiprocessing.Process
+    job_queue: multiprocessing.Queue
+    jobs_done: int = 0
+
+
+@dataclass
+class _YtdlpJob:
+    future: asyncio.Future
+    worker: _YtdlpWorker
+    download_path: str
+    progress_callback: Callable[[DownloadProgress], None] | None = None
+
+
+class YtdlpWorkerPool:
+    def __init__(
+        self,
+        size: int = 4,
+        max_jobs_per_worker: int = 50,
+        silent: bool = False,
+        resume: bool = False,
+    ) -> None:
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.silent = silent
+        self.resume = resume
+
+        self._context = multiprocessing.get_context()
+        self._result_queue = None
+        self._result_thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[_YtdlpWorker] = []
+        self._idle_workers: asyncio.Queue | None = None
+        self._jobs: dict[int, _YtdlpJob] = {}
+        self._job_ids = itertools.count()
+        self._closed = False
+
+    def _start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._idle_workers = asyncio.Queue()
+        self._result_queue = self._context.Queue()
+        self._result_thread = threading.Thread(
+            target=self._read_results,
+            name="gamdl-ytdlp-results",
+            daemon=True,
+        )
+        self._result_thread.start()
+
+    def _read_results(self) -> None:
+        while True:
+            result = self._result_queue.get()
+            if result is None:
+                return
+
+            try:
+                self._loop.call_soon_threadsafe(self._handle_result, *result)
+            except RuntimeError:
+                return
+
+    def _watch_worker(self, process: multiprocessing.Process) -> None:
+        process.join()
+        if not self._closed:
+            self._result_queue.put((None, "exit", (process.pid, process.exitcode)))
+
+    def _handle_exit(self, pid: int, exitcode: int | None) -> None:
+        for job in self._jobs.values():
+            if job.worker.process.pid == pid and not job.future.done():
+                job.future.set_exception(
+                    RuntimeError(f"yt-dlp exited with code {exitcode}")
+                )
+
+    def _handle_result(self, job_id: int | None, status: str, payload) -> None:
+        if status == "exit":
+            self._handle_exit(*payload)
+            return
+
+        job = self._jobs.get(job_id)
+        if job is None or job.future.done():
+            return
+
+        if status == "progress":
+            if job.progress_callback:
+                job.progress_callback(DownloadProgress(job.download_path, **payload))
+        elif status == "error":
+            error_repr, error_traceback = payload
+            job.future.set_exception(
+                RuntimeError(f"yt-dlp failed: {error_repr}\n{error_traceback}")
+            )
+        else:
+            job.future.set_result(None)
+
+    def _spawn_worker(self) -> _YtdlpWorker:
+        job_queue = self._context.Queue()
+        process = self._context.Process(
+            target=_ytdlp_worker_process,
+            args=(
+                self.silent,
+                self.resume,
+                self.max_jobs_per_worker,
+                job_queue,
+                self._result_queue,
+            ),
+            name="gamdl-ytdlp",
+            daemon=True,
+        )
+        process.start()
+        threading.Thread(
+            target=self._watch_worker,
+            args=(process,),
+            name="gamdl-ytdlp-watcher",
+            daemon=True,
+        ).start()
+
+        worker = _YtdlpWorker(process, job_queue)
+        self._workers.append(worker)
+
+        logger.debug("spawned", action="ytdlp_worker_pool", pid=process.pid)
+
+        return worker
+
+    async def _acquire_worker(self) -> _YtdlpWorker:
+        if self._loop is None:
+            self._start()
+
+        while True:
+            if self._idle_workers.empty() and len(self._workers) < self.size:
+                return self._spawn_worker()
+
+            worker = await self._idle_workers.get()
+            if worker.process.is_alive():
+                return worker
+
+            self._retire_worker(worker, terminate=False)
+
+    def _release_worker(self, worker: _YtdlpWorker) -> None:
+        worker.jobs_done += 1
+        if self.max_jobs_per_worker and worker.jobs_done >= self.max_jobs_per_worker:
+            self._retire_worker(worker, terminate=False)
+        else:
+            self._idle_workers.put_nowait(worker)
+
+    def _retire_worker(self, worker: _YtdlpWorker, terminate: bool) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+        if terminate and worker.process.is_alive():
+            worker.process.terminate()
+
+        logger.debug(
+            "retired",
+            action="ytdlp_worker_pool",
+            pid=worker.process.pid,
+            jobs_done=worker.jobs_done,
+        )
+
+        if not self._closed:
+            self._idle_workers.put_nowait(self._spawn_worker())
+
+    async def download(
+        self,
+        stream_url: str,
+        download_path: str,
+        progress_callback: Callable[[DownloadProgress], None] | None = None,
+    ) -> None:
+        worker = await self._acquire_worker()
+        job_id = next(self._job_ids)
+        job = _YtdlpJob(
+            self._loop.create_future(),
+            worker,
+            download_path,
+            progress_callback,
+        )
+        self._jobs[job_id] = job
+
+        try:
+            worker.job_queue.put((job_id, stream_url, download_path))
+            await asyncio.shield(job.future)
+        finally:
+            del self._jobs[job_id]
+            if job.future.done():
+                self._release_worker(worker)
+            else:
+                job.future.cancel()
+                self._retire_worker(worker, terminate=True)
+
+    def _join_workers(self, workers: list[_YtdlpWorker]) -> None:
+        for worker in workers:
+            worker.process.join(5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+
+    async def close(self) -> None:
+        self._closed = True
+
+        for worker in self._workers:
+            if worker.process.is_alive():
+                worker.job_queue.put(None)
+
+        workers = list(self._workers)
+        self._workers.clear()
+        await asyncio.to_thread(self._join_workers, workers)
+
+        if self._result_queue is not None:
+            self._result_queue.put(None)
+            await asyncio.to_thread(self._result_thread.join, 5)
@@ -15,7 +15,9 @@ from gamdl.interface.wvd import WVD
 
 from ..api.apple_music import AppleMusicApi
 from ..api.itunes import ItunesApi
+from ..api.transport import resolve_http2
 from ..api.wrapper import WrapperApi
+from ..utils import single_flight
 from .constants import IMAGE_FILE_EXTENSION_MAP
 from .enums import CoverFormat
 from .types import Cover, DecryptionKey, MediaRating, MediaTags, MediaType, PlaylistTags
@@ -32,6 +34,8 @@ class AppleMusicBaseInterface:
         cover_format: CoverFormat,
         cover_size: int,
         cdm: Cdm,
+        playlist_client: httpx.AsyncClient | None = None,
+        artwork_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.apple_music_api = apple_music_api
         self.itunes_api = itunes_api
@@ -39,6 +43,15 @@ class AppleMusicBaseInterface:
         self.cover_size = cover_size
         self.cdm = cdm
         self.wrapper_api = wrapper_api
+        self.playlist_client = playlist_client or httpx.AsyncClient(timeout=60.0)
+        self.artwork_client = artwork_client or httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+        )
+
+    async def close(self) -> None:
+        await self.playlist_client.aclose()
+        await self.artwork_client.aclose()
 
     @staticmethod
     def create_cdm(wvd_path: str | None = None) -> Cdm:
@@ -85,19 +98,19 @@ class AppleMusicBaseInterface:
 
         return widevine_pssh_data.SerializeToString()
 
-    @staticmethod
+    @single_flight()
     async def get_response(
+        self,
         url: str,
         valid_responses: list[int] = [200],
     ) -> httpx.Response:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code in valid_responses:
-                    return e.response
-                raise e
+        try:
+            response = await self.playlist_client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in valid_responses:
+                return e.response
+            raise e
 
         return response
 
@@ -130,10 +143,17 @@ class AppleMusicBaseInterface:
         wvd_path: str | None = None,
         itunes_api: ItunesApi | None = None,
         wrapper_api: WrapperApi | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        storefront_cache_path: str | None = None,
     ):
         itunes_api = itunes_api or await ItunesApi.create(
             storefront=apple_music_api.storefront,
             language=apple_music_api.language,
+            http2=http2,
+            storefront_cache_path=storefront_cache_path,
             **(
                 {"storefront_id": None}
                 if apple_music_api.storefront.lower() != "us"
@@ -142,6 +162,12 @@ class AppleMusicBaseInterface:
         )
         cdm = cls.create_cdm(wvd_path)
 
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
         base = cls(
             apple_music_api=apple_music_api,
             itunes_api=itunes_api,
@@ -149,6 +175,17 @@ class AppleMusicBaseInterface:
             cover_size=cover_size,
             cdm=cdm,
             wrapper_api=wrapper_api,
+            playlist_client=httpx.AsyncClient(
+                timeout=60.0,
+                limits=limits,
+                http2=resolve_http2(http2),
+            ),
+            artwork_client=httpx.AsyncClient(
+                timeout=30.0,
+                follow_redirects=True,
+                limits=limits,
+                http2=resolve_http2(http2),
+            ),
         )
         return base
 
@@ -205,16 +242,15 @@ class AppleMusicBaseInterface:
     async def get_cover_bytes(self, cover_url: str) -> bytes | None:
         log = logger.bind(action="get_cover_bytes", cover_url=cover_url)
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(cover_url, follow_redirects=True)
+        response = await self.artwork_client.get(cover_url)
 
-            if response.status_code == 404:
-                log.debug("cover_not_found")
-                return None
+        if response.status_code == 404:
+            log.debug("cover_not_found")
+            return None
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            return response.content
+        return response.content
 
     def _get_cover_template_url(self, metadata: dict) -> str:
         if self.cover_format == CoverFormat.RAW:
@@ -101,3 +101,5 @@ MEDIA_CODEC_FLAVOR_MAP = {
     "aac-fps-web": "30:cbcp256",
     "aac-he-fps-web": "34:cbcp64",
 }
+
+PAGINATION_CONCURRENCY = 8
@@ -1,10 +1,14 @@
 import asyncio
-from typing import Any, AsyncGenerator, Callable
+import copy
+from collections import deque
+from functools import partial
+from typing import Any, AsyncGenerator, AsyncIterable, Callable, Iterable
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 import structlog
 
-from ..utils import safe_gather
-from .constants import VALID_URL_PATTERN
+from ..utils import AdaptiveConcurrencyLimiter
+from .constants import PAGINATION_CONCURRENCY, VALID_URL_PATTERN
 from .enums import ArtistMediaType
 from .exceptions import (
     GamdlInterfaceMediaNotAllowedError,
@@ -14,7 +18,7 @@ from .exceptions import (
 )
 from .music_video import AppleMusicMusicVideoInterface
 from .song import AppleMusicSongInterface
-from .types import AppleMusicMedia, AppleMusicUrlInfo
+from .types import AppleMusicMedia, AppleMusicUrlInfo, ResolvedMedia
 from .uploaded_video import AppleMusicUploadedVideoInterface
 
 logger = structlog.get_logger(__name__)
@@ -34,7 +38,12 @@ class AppleMusicInterface:
         ) = None,
         flat_filter_function: Callable[[dict], Any] | None = None,
         concurrency: int = 1,
+        prefetch: int = 0,
+        prefetch_ttl: int = 300,
+        ordered: bool = True,
+        deduplicate: bool = False,
         disallowed_media_types: list[str] | None = None,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
     ) -> None:
         self.song = song
         self.music_video = music_video
@@ -43,10 +52,17 @@ class AppleMusicInterface:
         self.artist_select_items_function = artist_select_items_function
         self.flat_filter_function = flat_filter_function
         self.concurrency = concurrency
+        self.prefetch = prefetch
+        self.prefetch_ttl = prefetch_ttl
+        self.ordered = ordered
+        self.deduplicate = deduplicate
         self.disallowed_media_types = disallowed_media_types
+        self.limiter = limiter
 
         self.base = song.base
 
+        self._resolved_media: dict[str, asyncio.Future[ResolvedMedia]] = {}
+
     @staticmethod
     def get_url_info(url: str) -> AppleMusicUrlInfo | None:
         log = logger.bind(action="get_url_info", url=url)
@@ -91,9 +107,328 @@ class AppleMusicInterface:
     ) -> list[AppleMusicMedia]:
         results = []
         async for result in generator_or_coroutine:
-            results.append(result)
+            results.append(copy.copy(result) if result.partial else result)
         return results
 
+    async def _collect_media(
+        self,
+        media_generator: Callable[[], AsyncGenerator[AppleMusicMedia, None]],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[float, list[AppleMusicMedia]]:
+        async with semaphore:
+            results = await self._collect_generator(media_generator())
+        return asyncio.get_running_loop().time(), results
+
+    @staticmethod
+    async def _iter_media_generators(
+        media_generators: Iterable[Callable[[], AsyncGenerator[AppleMusicMedia, None]]],
+    ) -> AsyncGenerator[Callable[[], AsyncGenerator[AppleMusicMedia, None]], None]:
+        for media_generator in media_generators:
+            yield media_generator
+
+    async def _stream_media(
+        self,
+        media_generators: (
+            Iterable[Callable[[], AsyncGenerator[AppleMusicMedia, None]]]
+            | AsyncIterable[Callable[[], AsyncGenerator[AppleMusicMedia, None]]]
+        ),
+    ) -> AsyncGenerator[AppleMusicMedia, None]:
+        if not isinstance(media_generators, AsyncIterable):
+            media_generators = self._iter_media_generators(media_generators)
+
+        if self.concurrency == 1 and not self.prefetch:
+            async for media_generator in media_generators:
+                async for media in media_generator():
+                    yield media
+            return
+
+        log = logger.bind(action="stream_media")
+
+        media_generators = aiter(media_generators)
+        pending: deque[tuple[Callable, asyncio.Task]] = deque()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def schedule_next() -> None:
+            media_generator = await anext(media_generators, None)
+            if media_generator is not None:
+                pending.append(
+                    (
+                        media_generator,
+                        asyncio.create_task(
+                            self._collect_media(media_generator, semaphore)
+                        ),
+                    )
+                )
+
+        try:
+            for _ in range(self.concurrency + self.prefetch):
+                await schedule_next()
+
+            while pending:
+                if self.ordered:
+                    media_generator, task = pending.popleft()
+                    await asyncio.wait({task})
+                else:
+                    done, _ = await asyncio.wait(
+                        [task for _, task in pending],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    media_generator, task = next(
+                        entry for entry in pending if entry[1] in done
+                    )
+                    pending.remove((media_generator, task))
+
+                resolved_at, batch = task.result()
+                if (
+                    asyncio.get_running_loop().time() - resolved_at
+                    > self.prefetch_ttl
+                ):
+                    log.debug(
+                        "prefetch_expired",
+                        media_ids=[media.media_id for media in batch],
+                    )
+                    for media in batch:
+                        self._resolved_media.pop(media.media_id, None)
+                    _, batch = await self._collect_media(media_generator, semaphore)
+
+                await schedule_next()
+
+                for media in batch:
+                    yield media
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _get_page_offset(uri: str) -> int | None:
+        offset = dict(parse_qsl(urlparse(uri).query)).get("offset")
+        return int(offset) if offset and offset.isdigit() else None
+
+    @staticmethod
+    def _set_page_offset(uri: str, offset: int) -> str:
+        parsed_uri = urlparse(uri)
+        params = dict(parse_qsl(parsed_uri.query))
+        params["offset"] = str(offset)
+        return parsed_uri._replace(query=urlencode(params)).geturl()
+
+    async def _iter_extended_pages(
+        self,
+        relationship: dict,
+    ) -> AsyncGenerator[list[dict], None]:
+        log = logger.bind(action="iter_extended_pages")
+
+        next_uri = relationship.get("next")
+        href_uri = relationship.get("href")
+        if not next_uri:
+            return
+
+        extended_data = await self.base.apple_music_api.get_extended_api_data(
+            next_uri,
+            href_uri,
+        )
+        yield extended_data.get("data", [])
+
+        total = relationship.get("meta", {}).get("total")
+        page_offset = self._get_page_offset(next_uri)
+        next_uri = extended_data.get("next")
+        next_offset = self._get_page_offset(next_uri) if next_uri else None
+        if (
+            not total
+            or page_offset is None
+            or next_offset is None
+            or next_offset <= page_offset
+        ):
+            while next_uri:
+                extended_data = await self.base.apple_music_api.get_extended_api_data(
+                    next_uri,
+                    href_uri,
+                )
+                yield extended_data.get("data", [])
+                next_uri = extended_data.get("next")
+            return
+
+        page_uris = iter(
+            self._set_page_offset(next_uri, offset)
+            for offset in range(next_offset, total, next_offset - page_offset)
+        )
+        pending: deque[asyncio.Task] = deque()
+
+        def schedule_next() -> None:
+            page_uri = next(page_uris, None)
+            if page_uri is not None:
+                pending.append(
+                    asyncio.create_task(
+                        self.base.apple_music_api.get_extended_api_data(
+                            page_uri,
+                            href_uri,
+                        )
+                    )
+                )
+
+        log.debug("parallel", total=total, page_size=next_offset - page_offset)
+
+        try:
+            for _ in range(PAGINATION_CONCURRENCY):
+                schedule_next()
+
+            while pending:
+                extended_data = await pending.popleft()
+                schedule_next()
+                yield extended_data.get("data", [])
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _load_extended_pages(
+        self,
+        relationship: dict,
+        page_queue: asyncio.Queue,
+    ) -> None:
+        try:
+            async for page in self._iter_extended_pages(relationship):
+                page_queue.put_nowait(page)
+        except Exception as e:
+            page_queue.put_nowait(e)
+        finally:
+            page_queue.put_nowait(None)
+
+    async def _limit_generator(
+        self,
+        media_generator: AsyncGenerator[AppleMusicMedia, None],
+    ) -> AsyncGenerator[AppleMusicMedia, None]:
+        if not self.limiter:
+            async for media in media_generator:
+                yield media
+            return
+
+        try:
+            while True:
+                async with self.limiter:
+                    try:
+                        media = await media_generator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield media
+        finally:
+            await media_generator.aclose()
+
+    async def _reuse_resolved_media(self, media: AppleMusicMedia) -> bool:
+        log = logger.bind(action="reuse_resolved_media", media_id=media.media_id)
+
+        resolved_media_future = self._resolved_media.get(media.media_id)
+        if resolved_media_future is None:
+            return False
+
+        await asyncio.wait({resolved_media_future})
+        if resolved_media_future.cancelled():
+            log.debug("first_resolution_failed")
+            return False
+
+        resolved_media = resolved_media_future.result()
+
+        media.cover = resolved_media.cover
+        media.lyrics = resolved_media.lyrics
+        media.tags = resolved_media.tags
+        media.extra_tags = resolved_media.extra_tags
+        media.stream_info = resolved_media.stream_info
+        media.decryption_key = resolved_media.decryption_key
+        if media.playlist_metadata:
+            media.playlist_tags = self.base.get_playlist_tags(
+                media.playlist_metadata,
+                media.index,
+            )
+        media.partial = False
+
+        log.debug("success")
+
+        return True
+
+    def _release_resolved_media(
+        self,
+        media_id: str | None,
+        resolved_media_future: asyncio.Future | None,
+        media: AppleMusicMedia | None = None,
+    ) -> None:
+        if resolved_media_future is None or resolved_media_future.done():
+            return
+
+        if media is not None:
+            resolved_media_future.set_result(
+                ResolvedMedia(
+                    cover=media.cover,
+                    lyrics=media.lyrics,
+                    tags=media.tags,
+                    extra_tags=media.extra_tags,
+                    stream_info=media.stream_info,
+                    decryption_key=media.decryption_key,
+                )
+            )
+            asyncio.get_running_loop().call_later(
+                self.prefetch_ttl,
+                self._expire_resolved_media,
+                media_id,
+                resolved_media_future,
+            )
+            return
+
+        resolved_media_future.cancel()
+        self._expire_resolved_media(media_id, resolved_media_future)
+
+    def _expire_resolved_media(
+        self,
+        media_id: str | None,
+        resolved_media_future: asyncio.Future,
+    ) -> None:
+        if self._resolved_media.get(media_id) is resolved_media_future:
+            del self._resolved_media[media_id]
+
+    def invalidate_resolved_media(self, media_id: str) -> None:
+        resolved_media_future = self._resolved_media.get(media_id)
+        if resolved_media_future is not None and resolved_media_future.done():
+            del self._resolved_media[media_id]
+
+    async def _resolve_media(
+        self,
+        media: AppleMusicMedia,
+        media_generator: AsyncGenerator[AppleMusicMedia, None],
+    ) -> AsyncGenerator[AppleMusicMedia, None]:
+        resolved_media_key = None
+        resolved_media_future = None
+
+        try:
+            async for media in media_generator:
+                if not media.partial:
+                    self._release_resolved_media(
+                        resolved_media_key,
+                        resolved_media_future,
+                        media,
+                    )
+
+                yield media
+
+                self._run_media_type_filter(media)
+                await self._run_flat_filter(media)
+
+                if not self.deduplicate or not media.partial:
+                    continue
+
+                if await self._reuse_resolved_media(media):
+                    await media_generator.aclose()
+                    yield media
+                    return
+
+                resolved_media_key = media.media_id
+                resolved_media_future = asyncio.get_running_loop().create_future()
+                self._resolved_media[resolved_media_key] = resolved_media_future
+        except Exception as e:
+            self._release_resolved_media(resolved_media_key, resolved_media_future)
+            media.partial = False
+            media.error = e
+            yield media
+            return
+        finally:
+            self._release_resolved_media(resolved_media_key, resolved_media_future)
+
     async def _get_song_media(
         self,
         media_id: str,
@@ -111,17 +446,12 @@ class AppleMusicInterface:
             media_metadata=media_metadata,
             playlist_metadata=playlist_metadata,
         )
-        try:
-            async for media in self.song.get_media(media):
-                yield media
 
-                self._run_media_type_filter(media)
-                await self._run_flat_filter(media)
-        except Exception as e:
-            media.partial = False
-            media.error = e
+        async for media in self._resolve_media(
+            media,
+            self._limit_generator(self.song.get_media(media)),
+        ):
             yield media
-            return
 
     async def _get_music_video_media(
         self,
@@ -144,17 +474,11 @@ class AppleMusicInterface:
         media.media_metadata = media_metadata
         media.playlist_metadata = playlist_metadata
 
-        try:
-            async for media in self.music_video.get_media(media):
-                yield media
-
-                self._run_media_type_filter(media)
-                await self._run_flat_filter(media)
-        except Exception as e:
-            media.partial = False
-            media.error = e
+        async for media in self._resolve_media(
+            media,
+            self._limit_generator(self.music_video.get_media(media)),
+        ):
             yield media
-            return
 
     async def _get_uploaded_video_media(
         self,
@@ -207,37 +531,24 @@ class AppleMusicInterface:
         yield base_media
 
         tracks = base_media.media_metadata["relationships"]["tracks"]["data"]
-        tasks = [
-            (
-                self._get_song_media(
-                    media_id=track["id"],
-                    index=index,
-                    total=base_media.media_metadata["attributes"]["trackCount"],
-                    media_metadata=track,
-                    is_library=is_library,
-                )
-                if track["type"] in {"songs", "library-songs"}
-                else self._get_music_video_media(
-                    media_id=track["id"],
-                    index=index,
-                    total=base_media.media_metadata["attributes"]["trackCount"],
-                    media_metadata=track,
-                    is_library=is_library,
-                )
+        media_generators = (
+            partial(
+                (
+                    self._get_song_media
+                    if track["type"] in {"songs", "library-songs"}
+                    else self._get_music_video_media
+                ),
+                media_id=track["id"],
+                index=index,
+                total=base_media.media_metadata["attributes"]["trackCount"],
+                media_metadata=track,
+                is_library=is_library,
             )
             for index, track in enumerate(tracks)
-        ]
+        )
 
-        if self.concurrency == 1:
-            for task in tasks:
-                async for media in task:
-                    yield media
-        else:
-            collected_tasks = [self._collect_generator(task) for task in tasks]
-            batches = await safe_gather(*collected_tasks, limit=self.concurrency)
-            for batch in batches:
-                for media in batch:
-                    yield media
+        async for media in self._stream_media(media_generators):
+            yield media
 
     async def _get_playlist_media(
         self,
@@ -261,17 +572,6 @@ class AppleMusicInterface:
 
             self._run_media_type_filter(base_media)
             await self._run_flat_filter(base_media)
-
-            tracks = base_media.media_metadata["relationships"]["tracks"]["data"]
-            next_uri = base_media.media_metadata["relationships"]["tracks"].get("next")
-            href_uri = base_media.media_metadata["relationships"]["tracks"].get("href")
-            while next_uri:
-                extended_data = await self.base.apple_music_api.get_extended_api_data(
-                    next_uri,
-                    href_uri,
-                )
-                tracks.extend(extended_data["data"])
-                next_uri = extended_data.get("next")
         except Exception as e:
             base_media.partial = False
             base_media.error = e
@@ -280,37 +580,75 @@ class AppleMusicInterface:
 
         yield base_media
 
-        tasks = [
-            (
-                self._get_song_media(
-                    media_id=track["id"],
-                    index=index,
-                    media_metadata=track,
-                    playlist_metadata=base_media.media_metadata,
-                    is_library=is_library,
-                )
-                if track["type"] in {"songs", "library-songs"}
-                else self._get_music_video_media(
-                    media_id=track["id"],
-                    index=index,
-                    media_metadata=track,
-                    playlist_metadata=base_media.media_metadata,
-                    is_library=is_library,
-                )
+        track_generators = self._iter_playlist_track_generators(
+            base_media,
+            is_library,
+        )
+        try:
+            async for media in self._stream_media(track_generators):
+                yield media
+        finally:
+            await track_generators.aclose()
+
+    async def _iter_playlist_track_generators(
+        self,
+        base_media: AppleMusicMedia,
+        is_library: bool,
+    ) -> AsyncGenerator[Callable[[], AsyncGenerator[AppleMusicMedia, None]], None]:
+        tracks_relationship = base_media.media_metadata["relationships"]["tracks"]
+        tracks = tracks_relationship["data"]
+
+        playlist_metadata = base_media.media_metadata
+        if self.base.apple_music_api.compact_metadata:
+            playlist_metadata = {
+                key: value
+                for key, value in playlist_metadata.items()
+                if key != "relationships"
+            }
+
+        async def get_page_error_media(
+            error: Exception,
+        ) -> AsyncGenerator[AppleMusicMedia, None]:
+            yield AppleMusicMedia(
+                media_id=base_media.media_id,
+                media_metadata=base_media.media_metadata,
+                partial=False,
+                error=error,
             )
-            for index, track in enumerate(tracks)
-        ]
 
-        if self.concurrency == 1:
-            for task in tasks:
-                async for media in task:
-                    yield media
-        else:
-            collected_tasks = [self._collect_generator(task) for task in tasks]
-            batches = await safe_gather(*collected_tasks, limit=self.concurrency)
-            for batch in batches:
-                for media in batch:
-                    yield media
+        page_queue = asyncio.Queue()
+        page_loader = asyncio.create_task(
+            self._load_extended_pages(tracks_relationship, page_queue)
+        )
+
+        try:
+            page = list(tracks)
+            index = 0
+            while page is not None:
+                if isinstance(page, Exception):
+                    yield partial(get_page_error_media, page)
+                    break
+
+                for track in page:
+                    yield partial(
+                        (
+                            self._get_song_media
+                            if track["type"] in {"songs", "library-songs"}
+                            else self._get_music_video_media
+                        ),
+                        media_id=track["id"],
+                        index=index,
+                        media_metadata=track,
+                        playlist_metadata=playlist_metadata,
+                        is_library=is_library,
+                    )
+                    index += 1
+
+                page = await page_queue.get()
+                if isinstance(page, list):
+                    tracks.extend(page)
+        finally:
+            page_loader.cancel()
 
     async def _get_artist_media(
         self,
@@ -350,15 +688,8 @@ class AppleMusicInterface:
                     str(artist_media_type),
                 )
 
-            next_uri = items_relation.get("next")
-            href_uri = items_relation.get("href")
-            while next_uri:
-                extended_data = await self.base.apple_music_api.get_extended_api_data(
-                    next_uri,
-                    href_uri,
-                )
-                items.extend(extended_data.get("data", []))
-                next_uri = extended_data.get("next")
+            async for page in self._iter_extended_pages(items_relation):
+                items.extend(page)
         except Exception as e:
             yield AppleMusicMedia(
                 media_id=media_id,
@@ -379,11 +710,12 @@ class AppleMusicInterface:
         else:
             selected_items = items[:1]
 
-        tasks = []
+        media_generators = []
         for index, item in enumerate(selected_items):
             if item["type"] in {"songs", "library-songs"}:
-                tasks.append(
-                    self._get_song_media(
+                media_generators.append(
+                    partial(
+                        self._get_song_media,
                         media_id=item["id"],
                         index=index,
                         total=len(selected_items),
@@ -391,14 +723,16 @@ class AppleMusicInterface:
                     )
                 )
             elif item["type"] in {"albums", "library-albums"}:
-                tasks.append(
-                    self._get_album_media(
+                media_generators.append(
+                    partial(
+                        self._get_album_media,
                         media_id=item["id"],
                     )
                 )
             else:
-                tasks.append(
-                    self._get_music_video_media(
+                media_generators.append(
+                    partial(
+                        self._get_music_video_media,
                         media_id=item["id"],
                         index=index,
                         total=len(selected_items),
@@ -406,16 +740,8 @@ class AppleMusicInterface:
                     )
                 )
 
-        if self.concurrency == 1:
-            for task in tasks:
-                async for media in task:
-                    yield media
-        else:
-            collected_tasks = [self._collect_generator(task) for task in tasks]
-            batches = await safe_gather(*collected_tasks, limit=self.concurrency)
-            for batch in batches:
-                for media in batch:
-                    yield media
+        async for media in self._stream_media(media_generators):
+            yield media
 
     async def get_media_from_url(
         self,
@@ -23,6 +23,7 @@ from .types import (
     DecryptionKeyAv,
     Lyrics,
     MediaFileFormat,
+    MediaTags,
     StreamInfo,
     StreamInfoAv,
 )
@@ -56,6 +57,10 @@ class AppleMusicSongInterface:
             song_id=song_metadata["id"],
         )
 
+        if not self.base.apple_music_api.include_lyrics:
+            log.debug("lyrics_not_requested")
+            return None
+
         if song_metadata["attributes"]["playParams"].get("isLibrary"):
             log.debug("library_song_no_lyrics")
             return None
@@ -634,6 +639,82 @@ class AppleMusicSongInterface:
 
         return stream_info_av
 
+    async def _get_playback(
+        self,
+        media: AppleMusicMedia,
+    ) -> dict | None:
+        if not self.base.wrapper_api or media.is_library:
+            return None
+
+        return await self.base.wrapper_api.get_playback(media.media_id)
+
+    async def _get_webplayback(
+        self,
+        media: AppleMusicMedia,
+    ) -> dict | None:
+        if (
+            self.base.wrapper_api
+            and not media.is_library
+            and not any(codec.is_web for codec in self.codec_priority)
+        ):
+            return None
+
+        return await self.base.apple_music_api.get_webplayback(
+            media.media_id,
+            media.is_library,
+        )
+
+    async def _get_tags(
+        self,
+        lyrics_task: asyncio.Task,
+        playback_task: asyncio.Task,
+        webplayback_task: asyncio.Task,
+    ) -> MediaTags:
+        lyrics = await lyrics_task
+        playback = await playback_task
+        webplayback = await webplayback_task
+
+        return await self.base.get_tags_from_asset_info(
+            (playback or webplayback)["songList"][0]["assets"][0]["metadata"],
+            lyrics.unsynced if lyrics else None,
+            self.use_album_date,
+        )
+
+    async def _get_stream_info_and_decryption_key(
+        self,
+        media: AppleMusicMedia,
+        playback_task: asyncio.Task,
+        webplayback_task: asyncio.Task,
+    ) -> tuple[StreamInfoAv, DecryptionKeyAv | None]:
+        stream_info = await self.get_stream_info(
+            media.media_id,
+            media.is_library,
+            await webplayback_task,
+            await playback_task,
+        )
+
+        if stream_info.audio_track.drm_free:
+            return stream_info, None
+
+        if (
+            not self.base.wrapper_api and not stream_info.audio_track.widevine_pssh
+        ) or (
+            self.base.wrapper_api
+            and not stream_info.audio_track.fairplay_key
+            and not stream_info.audio_track.use_cenc
+        ):
+            raise GamdlInterfaceDecryptionNotAvailableError(media_id=media.media_id)
+
+        if not stream_info.audio_track.widevine_pssh:
+            return stream_info, None
+
+        return stream_info, DecryptionKeyAv(
+            audio_track=await self.base.get_decryption_key(
+                stream_info.audio_track.widevine_pssh,
+                media.media_id,
+            )
+        )
+
     async def get_media(
         self,
         media: AppleMusicMedia,
@@ -669,71 +750,44 @@ class AppleMusicSongInterface:
                 media.index,
             )
 
-        media.cover = await self.base.get_cover(media.media_metadata)
-
-        media.lyrics = await self.get_lyrics(media.media_metadata)
-
-        if self.base.wrapper_api:
-            playback = (
-                await self.base.wrapper_api.get_playback(media.media_id)
-                if not media.is_library
-                else None
-            )
-            webplayback = (
-                await self.base.apple_music_api.get_webplayback(
-                    media.media_id,
-                    media.is_library,
+        cover_task = asyncio.create_task(self.base.get_cover(media.media_metadata))
+        lyrics_task = asyncio.create_task(self.get_lyrics(media.media_metadata))
+        playback_task = asyncio.create_task(self._get_playback(media))
+        webplayback_task = asyncio.create_task(self._get_webplayback(media))
+        tags_task = asyncio.create_task(
+            self._get_tags(lyrics_task, playback_task, webplayback_task)
+        )
+        tasks = [
+            cover_task,
+            lyrics_task,
+            playback_task,
+            webplayback_task,
+            tags_task,
+        ]
+        if not self.skip_stream_info:
+            stream_info_task = asyncio.create_task(
+                self._get_stream_info_and_decryption_key(
+                    media,
+                    playback_task,
+                    webplayback_task,
                 )
-                if media.is_library
-                or any(codec.is_web for codec in self.codec_priority)
-                else None
             )
-        else:
-            playback = None
-            webplayback = await self.base.apple_music_api.get_webplayback(
-                media.media_id,
-                media.is_library,
-            )
-
-        if playback:
-            media.tags = await self.base.get_tags_from_asset_info(
-                playback["songList"][0]["assets"][0]["metadata"],
-                media.lyrics.unsynced if media.lyrics else None,
-                self.use_album_date,
-            )
-        else:
-            media.tags = await self.base.get_tags_from_asset_info(
-                webplayback["songList"][0]["assets"][0]["metadata"],
-                media.lyrics.unsynced if media.lyrics else None,
-                self.use_album_date,
-            )
-
+            tasks.append(stream_info_task)
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        media.cover = cover_task.result()
+        media.lyrics = lyrics_task.result()
+        media.tags = tags_task.result()
         if not self.skip_stream_info:
-            media.stream_info = await self.get_stream_info(
-                media.media_id,
-                media.is_library,
-                webplayback,
-                playback,
-            )
-
-            if media.stream_info.audio_track.drm_free:
-                pass
-            elif (
-                not self.base.wrapper_api
-                and not media.stream_info.audio_track.widevine_pssh
-            ) or (
-                self.base.wrapper_api
-                and not media.stream_info.audio_track.fairplay_key
-                and not media.stream_info.audio_track.use_cenc
-            ):
-                raise GamdlInterfaceDecryptionNotAvailableError(media_id=media.media_id)
-            elif media.stream_info.audio_track.widevine_pssh:
-                media.decryption_key = DecryptionKeyAv(
-                    audio_track=await self.base.get_decryption_key(
-                        media.stream_info.audio_track.widevine_pssh,
-                        media.media_id,
-                    )
-                )
+            media.stream_info, decryption_key = stream_info_task.result()
+            if decryption_key:
+                media.decryption_key = decryption_key
 
         media.partial = False
 
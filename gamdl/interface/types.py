@@ -173,6 +173,16 @@ class AppleMusicMedia:
     decryption_key: DecryptionKeyAv | None = None
 
 
+@dataclass
+class ResolvedMedia:
+    cover: Cover | None = None
+    lyrics: Lyrics | None = None
+    tags: MediaTags | None = None
+    extra_tags: dict | None = None
+    stream_info: StreamInfoAv | None = None
+    decryption_key: DecryptionKeyAv | None = None
+
+
 @dataclass
 class AppleMusicUrlInfo:
     storefront: str = None
@@ -1,10 +1,83 @@
 import asyncio
+import copy
+import functools
+import json
+import random
+import re
 import string
+import sys
+import time
 import typing
+from collections import deque
 
+import structlog
 
-async def async_subprocess(*args: str, silent: bool = False) -> None:
-    if silent:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = structlog.get_logger(__name__)
+
+
+@functools.cache
+def _is_orjson_available() -> bool:
+    if orjson is None:
+        logger.warning(
+            'Fast JSON decoding requested but the "orjson" package is not '
+            "installed, falling back to json",
+            action="decode_json",
+        )
+        return False
+
+    return True
+
+
+def decode_json(content: bytes | str, fast: bool = False) -> typing.Any:
+    if fast and _is_orjson_available():
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+async def _read_subprocess_output(
+    proc: asyncio.subprocess.Process,
+    output_function: typing.Callable[[str], None],
+    silent: bool,
+) -> bytes:
+    output = bytearray()
+    buffer = b""
+
+    while chunk := await proc.stdout.read(65536):
+        if not silent:
+            sys.stdout.write(chunk.decode(errors="replace"))
+            sys.stdout.flush()
+
+        output += chunk
+        del output[:-65536]
+
+        *lines, buffer = re.split(rb"[\r\n]+", buffer + chunk)
+        for line in lines:
+            if line:
+                output_function(line.decode(errors="replace"))
+
+    if buffer:
+        output_function(buffer.decode(errors="replace"))
+
+    return bytes(output)
+
+
+async def async_subprocess(
+    *args: str,
+    silent: bool = False,
+    output_function: typing.Callable[[str], None] | None = None,
+) -> None:
+    if output_function:
+        additional_args = {
+            "stdout": asyncio.subprocess.PIPE,
+            "stderr": asyncio.subprocess.STDOUT,
+        }
+    elif silent:
         additional_args = {
             "stdout": asyncio.subprocess.PIPE,
             "stderr": asyncio.subprocess.PIPE,
@@ -17,7 +90,18 @@ async def async_subprocess(*args: str, silent: bool = False) -> None:
         **additional_args,
     )
 
-    stdout, stderr = await proc.communicate()
+    try:
+        if output_function:
+            stdout = await _read_subprocess_output(proc, output_function, silent)
+            stderr = None
+            await proc.wait()
+        else:
+            stdout, stderr = await proc.communicate()
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
 
     if proc.returncode != 0:
         msg = (
@@ -32,20 +116,391 @@ async def async_subprocess(*args: str, silent: bool = False) -> None:
         raise Exception(msg)
 
 
-async def safe_gather(
-    *tasks: typing.Awaitable[typing.Any],
-    limit: int = 10,
-) -> list[typing.Any]:
-    semaphore = asyncio.Semaphore(limit)
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        name: str,
+        maximum: int,
+        minimum: int = 1,
+        initial: int | None = None,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 5.0,
+        throughput_tolerance: float = 0.25,
+    ) -> None:
+        self.name = name
+        self.maximum = max(maximum, minimum)
+        self.minimum = minimum
+        self.limit = min(max(initial or minimum, minimum), self.maximum)
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.throughput_tolerance = throughput_tolerance
 
-    async def bounded_task(task: typing.Awaitable[typing.Any]) -> typing.Any:
-        async with semaphore:
-            return await task
+        self._active = 0
+        self._condition = asyncio.Condition()
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._window_count = 0
+        self._last_throughput: float | None = None
 
-    return await asyncio.gather(
-        *(bounded_task(task) for task in tasks),
-        return_exceptions=True,
-    )
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def _set_limit(self, limit: int, reason: str, **kwargs) -> None:
+        limit = min(max(limit, self.minimum), self.maximum)
+        if limit == self.limit:
+            return
+
+        logger.debug(
+            "increase" if limit > self.limit else "decrease",
+            action="adaptive_concurrency",
+            name=self.name,
+            reason=reason,
+            previous_limit=self.limit,
+            limit=limit,
+            **kwargs,
+        )
+        self.limit = limit
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self._set_limit(self.limit + 1, "successes")
+
+    def record_throttle(self, status_code: int | None = None) -> None:
+        self._successes = 0
+
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+
+        self._last_decrease = now
+        self._set_limit(
+            int(self.limit * self.decrease_factor),
+            "throttled",
+            status_code=status_code,
+        )
+
+    def record_throughput(self, byte_count: int) -> None:
+        self._window_bytes += byte_count
+        self._window_count += 1
+        if self._window_count < self.limit:
+            return
+
+        now = time.monotonic()
+        throughput = self._window_bytes / max(now - self._window_start, 1e-6)
+        last_throughput = self._last_throughput
+
+        self._window_start = now
+        self._window_bytes = 0
+        self._window_count = 0
+        self._last_throughput = throughput
+
+        if last_throughput is None or throughput >= last_throughput:
+            self._set_limit(self.limit + 1, "throughput", throughput=int(throughput))
+        elif throughput < last_throughput * (1 - self.throughput_tolerance):
+            self._set_limit(
+                int(self.limit * self.decrease_factor),
+                "throughput",
+                throughput=int(throughput),
+            )
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RetryBudget:
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        minimum: int = 10,
+        window: float = 10.0,
+    ) -> None:
+        self.ratio = ratio
+        self.minimum = minimum
+        self.window = window
+
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and now - timestamps[0] > self.window:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        now = time.monotonic()
+        self._prune(now)
+
+        if len(self._retries) >= self.minimum + len(self._requests) * self.ratio:
+            logger.debug(
+                "exhausted",
+                action="retry_budget",
+                requests=len(self._requests),
+                retries=len(self._retries),
+            )
+            return False
+
+        self._retries.append(now)
+        return True
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        jitter: float = 1.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.jitter = jitter
+
+        self.state = "closed"
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+        self._probe_done = asyncio.Event()
+
+    def _set_state(self, state: str, **kwargs) -> None:
+        if state == self.state:
+            return
+
+        (logger.warning if state == "open" else logger.info)(
+            state,
+            action="circuit_breaker",
+            name=self.name,
+            previous_state=self.state,
+            **kwargs,
+        )
+        self.state = state
+
+    async def acquire(self) -> None:
+        while self.state != "closed":
+            if self.state == "open":
+                delay = self._open_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay + random.uniform(0, self.jitter))
+                    continue
+
+                self._set_state("half_open")
+
+            if not self._probing:
+                self._probing = True
+                self._probe_done = asyncio.Event()
+                return
+
+            await self._probe_done.wait()
+            await asyncio.sleep(random.uniform(0, self.jitter))
+
+    def _release_probe(self) -> None:
+        if self._probing:
+            self._probing = False
+            self._probe_done.set()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._set_state("closed")
+        self._release_probe()
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        self._failures += 1
+
+        if (
+            retry_after is not None
+            or self.state == "half_open"
+            or self._failures >= self.failure_threshold
+        ):
+            delay = self.recovery_timeout if retry_after is None else retry_after
+            self._open_until = max(self._open_until, time.monotonic() + delay)
+            self._set_state("open", delay=delay, failures=self._failures)
+
+        self._release_probe()
+
+    def release(self) -> None:
+        self._release_probe()
+
+
+class RequestBatcher:
+    def __init__(
+        self,
+        fetch: typing.Callable[
+            [typing.Hashable, list[str]],
+            typing.Awaitable[dict[str, typing.Any]],
+        ],
+        window: float = 0.02,
+        max_size: int = 100,
+    ) -> None:
+        self.fetch = fetch
+        self.window = window
+        self.max_size = max_size
+
+        self._pending: dict[typing.Hashable, dict[str, list[asyncio.Future]]] = {}
+        self._timers: dict[typing.Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get(self, group: typing.Hashable, item_id: str) -> typing.Any:
+        future = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.setdefault(group, {})
+        batch.setdefault(item_id, []).append(future)
+
+        if len(batch) >= self.max_size:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = asyncio.get_running_loop().call_later(
+                self.window,
+                self._flush,
+                group,
+            )
+
+        return await future
+
+    def _flush(self, group: typing.Hashable) -> None:
+        timer = self._timers.pop(group, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(group, None)
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run(group, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        group: typing.Hashable,
+        batch: dict[str, list[asyncio.Future]],
+    ) -> None:
+        log = logger.bind(action="request_batch", group=group, size=len(batch))
+
+        try:
+            results = await self.fetch(group, list(batch))
+        except Exception as e:
+            log.debug("failed", error=repr(e))
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        except BaseException:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+
+        for item_id, futures in batch.items():
+            result = results.get(item_id)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    future.set_result(copy.deepcopy(result) if index else result)
+
+        log.debug("success")
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+
+    return value
+
+
+def _consume_task_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def single_flight(copy_result: bool = False):
+    def decorator(func):
+        in_flight: dict[typing.Hashable, asyncio.Task] = {}
+        shared: set[asyncio.Task] = set()
+
+        def release(key: typing.Hashable, task: asyncio.Task) -> None:
+            in_flight.pop(key, None)
+            shared.discard(task)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _freeze((args, kwargs))
+
+            task = in_flight.get(key)
+            if task is None:
+                task = asyncio.create_task(func(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(_consume_task_exception)
+
+                try:
+                    result = await asyncio.shield(task)
+                    is_shared = task in shared
+                finally:
+                    if task.done():
+                        release(key, task)
+                    else:
+                        task.add_done_callback(lambda _: release(key, task))
+
+                return copy.deepcopy(result) if copy_result and is_shared else result
+
+            shared.add(task)
+            logger.debug("shared", action="single_flight", func=func.__qualname__)
+
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result) if copy_result else result
+
+        return wrapper
+
+    return decorator
 
 
 class CustomStringFormatter(string.Formatter):
@@ -0,0 +1,152 @@
+import asyncio
+import types
+
+import pytest
+
+from gamdl.interface.interface import AppleMusicInterface
+
+
+class FakeSongInterface:
+    def __init__(self, api=None):
+        self.base = types.SimpleNamespace(apple_music_api=api)
+
+    async def get_media(self, media):
+        media.media_metadata = media.media_metadata or {"type": "songs"}
+        yield media
+
+        await asyncio.sleep(0)
+        media.partial = False
+        yield media
+
+
+async def collect_playlist(interface, media_id="p"):
+    return [
+        (media.media_id, media.partial)
+        async for media in interface._get_playlist_media(media_id)
+    ]
+
+
+class FakePlaylistApi:
+    compact_metadata = False
+
+    def __init__(self, track_ids, page_size=100, missing=()):
+        self.track_ids = track_ids
+        self.page_size = page_size
+        self.missing = set(missing)
+
+    def get_page(self, offset):
+        page = [
+            {"id": track_id, "type": "songs"}
+            for track_id in self.track_ids[offset : offset + self.page_size]
+            if track_id not in self.missing
+        ]
+        next_offset = offset + self.page_size
+        return {
+            "data": page,
+            "next": (
+                f"/v1/catalog/us/playlists/p/tracks?offset={next_offset}"
+                if next_offset < len(self.track_ids)
+                else None
+            ),
+        }
+
+    async def get_playlist(self, media_id):
+        first_page = self.get_page(0)
+        return {
+            "data": [
+                {
+                    "id": media_id,
+                    "type": "playlists",
+                    "attributes": {},
+                    "relationships": {
+                        "tracks": {
+                            "href": "/v1/catalog/us/playlists/p/tracks",
+                            "next": first_page["next"],
+                            "data": first_page["data"],
+                            "meta": {"total": len(self.track_ids)},
+                        }
+                    },
+                }
+            ]
+        }
+
+    async def get_extended_api_data(self, next_uri, href_uri):
+        return self.get_page(int(next_uri.split("offset=")[1]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "concurrency,prefetch",
+    [(1, 0), (2, 0), (1, 2), (4, 4)],
+)
+async def test_stream_media_keeps_partial_yields(concurrency, prefetch):
+    api = FakePlaylistApi([str(index) for index in range(5)])
+    interface = AppleMusicInterface(
+        FakeSongInterface(api),
+        None,
+        None,
+        concurrency=concurrency,
+        prefetch=prefetch,
+    )
+
+    results = await collect_playlist(interface)
+
+    assert results[1:] == [
+        (str(index), partial) for index in range(5) for partial in (True, False)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extended_pages_use_server_page_size():
+    track_ids = [str(index) for index in range(500)]
+    missing = {"150", "151", "152"}
+    api = FakePlaylistApi(track_ids, missing=missing)
+    interface = AppleMusicInterface(FakeSongInterface(api), None, None)
+
+    results = await collect_playlist(interface)
+
+    assert [media_id for media_id, partial in results[1:] if not partial] == [
+        track_id for track_id in track_ids if track_id not in missing
+    ]
+
+
+class CountingSongInterface(FakeSongInterface):
+    def __init__(self):
+        super().__init__()
+        self.resolved = 0
+
+    async def get_media(self, media):
+        async for media in super().get_media(media):
+            if not media.partial:
+                self.resolved += 1
+                media.tags = f"tags-{self.resolved}"
+            yield media
+
+
+async def resolve_song(interface, media_id):
+    return [media async for media in interface._get_song_media(media_id)][-1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch_ttl,expected_resolved", [(300, 1), (0, 2)])
+async def test_deduplicate_reuses_resolved_media_within_ttl(
+    prefetch_ttl,
+    expected_resolved,
+):
+    song = CountingSongInterface()
+    interface = AppleMusicInterface(
+        song,
+        None,
+        None,
+        deduplicate=True,
+        prefetch_ttl=prefetch_ttl,
+    )
+
+    first = await resolve_song(interface, "1")
+    await asyncio.sleep(0.01)
+    second = await resolve_song(interface, "1")
+
+    assert song.resolved == expected_resolved
+    assert not second.partial
+    assert second.tags == (first.tags if expected_resolved == 1 else "tags-2")
+    assert second is not first
@@ -0,0 +1,36 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from gamdl.api.transport import CircuitBreakerTransport
+from gamdl.utils import RetryBudget
+
+
+class ThrottlingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, throttle_for: float) -> None:
+        self.throttle_until = time.monotonic() + throttle_for
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        if time.monotonic() < self.throttle_until:
+            return httpx.Response(429, headers={"retry-after": "1"})
+
+        return httpx.Response(200)
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_retries_do_not_spend_budget():
+    async with httpx.AsyncClient(
+        transport=CircuitBreakerTransport(
+            RetryBudget(0.2),
+            ThrottlingTransport(1.0),
+            max_retries=6,
+        )
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get("https://amp-api.music.apple.com/v1/test") for _ in range(30))
+        )
+
+    assert all(response.status_code == 200 for response in responses)
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from gamdl.utils import RequestBatcher
+
+
+@pytest.mark.asyncio
+async def test_request_batcher_copies_duplicate_results():
+    async def fetch(group, item_ids):
+        return {item_id: {"id": item_id, "attributes": {}} for item_id in item_ids}
+
+    batcher = RequestBatcher(fetch, window=0.01)
+
+    first, second = await asyncio.gather(
+        batcher.get("songs", "1"),
+        batcher.get("songs", "1"),
+    )
+
+    assert first == second
+    assert first is not second
+    assert first["attributes"] is not second["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_request_batcher_cancels_waiters_with_batch():
+    fetch_started = asyncio.Event()
+
+    async def fetch(group, item_ids):
+        fetch_started.set()
+        await asyncio.Event().wait()
+
+    batcher = RequestBatcher(fetch, window=0.01)
+    waiters = [asyncio.create_task(batcher.get("songs", "1")) for _ in range(2)]
+
+    await fetch_started.wait()
+    for task in batcher._tasks:
+        task.cancel()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*waiters, return_exceptions=True),
+        1,
+    )
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)